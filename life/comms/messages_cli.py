@@ -20,7 +20,6 @@ from fncli import cli
 
 from lifeos.core.comms.messages import signal
 from lifeos.core.comms.messages import telegram as _tg
-from lifeos.core.comms.messages.telegram_sync import save_credentials, sync
 from lifeos.core.errors import LifeError, ValidationError
 from lifeos.core.lib.store import get_db
 
@@ -226,6 +225,9 @@ def messages(
 @cli("life messages", name="sync", flags={"full": ["--full"]})
 def sync_cmd(person: str, full: bool = False):
     """Sync message history from telegram"""
+    # telethon is heavy and autodiscover imports this module on every run; load it only here
+    from lifeos.core.comms.messages.telegram_sync import sync  # noqa: PLC0415
+
     chat_id = _tg.resolve_chat_id(person)
     chat_ref: str | int = chat_id if chat_id is not None else person
 
@@ -236,6 +238,8 @@ def sync_cmd(person: str, full: bool = False):
 @cli("life messages", name="auth")
 def auth_cmd(api_id: int, api_hash: str):
     """Store Telegram user API credentials (from my.telegram.org)"""
+    from lifeos.core.comms.messages.telegram_sync import save_credentials  # noqa: PLC0415 — see sync_cmd
+
     save_credentials(api_id, api_hash)
     print(f"saved — api_id={api_id}. run: life messages sync <person> to pull history")
 
@@ -1,4 +1,5 @@
 import dataclasses
+from collections import Counter
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 
@@ -75,8 +76,9 @@ def _format_ratio(done: int, total: int) -> str:
 def _count_defers(window_start: date, window_end: date) -> int:
     with get_db() as conn:
         row = conn.execute(
-            "SELECT COUNT(*) FROM mutations WHERE field = 'defer' AND date(mutated_at) >= ? AND date(mutated_at) <= ?",
-            (window_start.isoformat(), window_end.isoformat()),
+            # bare ISO range (not date(mutated_at)) so the (field, mutated_at) index applies
+            "SELECT COUNT(*) FROM mutations WHERE field = 'defer' AND mutated_at >= ? AND mutated_at < ?",
+            (window_start.isoformat(), (window_end + timedelta(days=1)).isoformat()),
         ).fetchone()
         return row[0] if row else 0
 
@@ -84,10 +86,8 @@ def _count_defers(window_start: date, window_end: date) -> int:
 def _count_overdue_resets(window_start: date, window_end: date) -> int:
     with get_db() as conn:
         row = conn.execute(
-            "SELECT COUNT(*) FROM mutations "
-            "WHERE reason = 'overdue_reset' "
-            "AND date(mutated_at) >= ? AND date(mutated_at) <= ?",
-            (window_start.isoformat(), window_end.isoformat()),
+            "SELECT COUNT(*) FROM mutations WHERE reason = 'overdue_reset' AND mutated_at >= ? AND mutated_at < ?",
+            (window_start.isoformat(), (window_end + timedelta(days=1)).isoformat()),
         ).fetchone()
         return row[0] if row else 0
 
@@ -120,16 +120,30 @@ def build_feedback_snapshot(
     top_all = [t for t in all_tasks if _is_top_level(t)]
     top_pending = [t for t in pending_tasks if _is_top_level(t)]
 
-    closure_earned = sum(_task_weight(t) for t in top_all if _in_window(t.completed_at, window_start, today))
+    prior_start = window_start - timedelta(days=window_days)
+    prior_end = window_start - timedelta(days=1)
+
+    # classify each completion once: this window feeds closure/partner/tags, the prior one only momentum
+    closure_earned = 0
+    prior_earned = 0
+    done_in_window: list[Task] = []
+    for t in top_all:
+        if _in_window(t.completed_at, window_start, today):
+            closure_earned += _task_weight(t)
+            done_in_window.append(t)
+        elif _in_window(t.completed_at, prior_start, prior_end):
+            prior_earned += _task_weight(t)
+
     closure_open = sum(_task_weight(t) for t in top_pending)
     closure_possible = closure_earned + closure_open
     closure_score = closure_earned / closure_possible if closure_possible else 0.0
 
     ptag = get_partner_tag()
-    partner_done = sum(
-        1 for t in top_all if ptag and ptag in (t.tags or []) and _in_window(t.completed_at, window_start, today)
-    )
-    partner_open = sum(1 for t in top_pending if ptag and ptag in (t.tags or []))
+    # one tally per side; partner and tag stats then read counts instead of rescanning tasks
+    done_by_tag = Counter(tag for t in done_in_window for tag in set(t.tags or ()))
+    open_by_tag = Counter(tag for t in top_pending for tag in set(t.tags or ()))
+    partner_done = done_by_tag[ptag] if ptag else 0
+    partner_open = open_by_tag[ptag] if ptag else 0
 
     defer_count = _count_defers(window_start, today)
     overdue_resets = _count_overdue_resets(window_start, today)
@@ -146,9 +160,6 @@ def build_feedback_snapshot(
         habit_checked += min(weeks_hit, weeks_in_window)
     habit_rate = habit_checked / habit_possible if habit_possible else 0.0
 
-    prior_start = window_start - timedelta(days=window_days)
-    prior_end = window_start - timedelta(days=1)
-    prior_earned = sum(_task_weight(t) for t in top_all if _in_window(t.completed_at, prior_start, prior_end))
     _momentum_threshold = 0.10
     if prior_earned == 0:
         momentum = "↑" if closure_earned > 0 else "≈"
@@ -159,11 +170,10 @@ def build_feedback_snapshot(
     else:
         momentum = "≈"
 
-    tracked_tags = set(TAG_WEIGHT.keys())
     tag_stats: dict[str, TagStat] = {}
-    for tag in tracked_tags:
-        done = sum(1 for t in top_all if tag in (t.tags or []) and _in_window(t.completed_at, window_start, today))
-        open_ = sum(1 for t in top_pending if tag in (t.tags or []))
+    for tag in TAG_WEIGHT:
+        done = done_by_tag[tag]
+        open_ = open_by_tag[tag]
         if done or open_:
             tag_stats[tag] = TagStat(open=open_, done_7d=done)
 
@@ -28,7 +28,7 @@ __all__ = [
     "get_habit",
     "get_habits",
     "get_streak",
-    "get_subhabits",
+    "get_subhabits_by_parent",
     "merge_habit",
     "rename_habit",
     "resolve_habit",
@@ -226,13 +226,16 @@ def get_streak(habit_id: str) -> int:
     return streak
 
 
-def get_subhabits(parent_id: str) -> list["Habit"]:
+def get_subhabits_by_parent() -> dict[str, list[Habit]]:
+    """All live subhabits in one query, grouped by parent id."""
     with get_db() as conn:
-        return _fetch_habits(
-            conn,
-            "parent_id = ? AND deleted_at IS NULL AND archived_at IS NULL ORDER BY created ASC",
-            (parent_id,),
+        subs = _fetch_habits(
+            conn, "parent_id IS NOT NULL AND deleted_at IS NULL AND archived_at IS NULL ORDER BY created ASC"
         )
+    by_parent: dict[str, list[Habit]] = {}
+    for sub in subs:
+        by_parent.setdefault(sub.parent_id or "", []).append(sub)
+    return by_parent
 
 
 def get_archived_habits() -> list[Habit]:
@@ -350,7 +353,7 @@ def merge_habit(source: Habit, target: Habit) -> None:
 def check_habit_cmd(habit: Habit, check_time: str | None = None) -> None:
     if check_time:
         check_habit(habit.id, check_time=check_time)
-        render_done_row(habit.content.lower(), check_time, habit.tags, habit.id, is_habit=True)
+        render_done_row(habit.content_lower, check_time, habit.tags, habit.id, is_habit=True)
         return
 
     updated = toggle_check(habit.id)
@@ -360,7 +363,7 @@ def check_habit_cmd(habit: Habit, check_time: str | None = None) -> None:
         if checked_today:
             today_checks = [c for c in updated.checks if c.date() == today_date]
             time_str = fmt_time(max(today_checks)) if today_checks else ""
-            render_done_row(habit.content.lower(), time_str, habit.tags, habit.id, is_habit=True)
+            render_done_row(habit.content_lower, time_str, habit.tags, habit.id, is_habit=True)
 
 
 @cli("life")
@@ -388,7 +391,7 @@ def merge(source_ref: str, target_ref: str) -> None:
     source = resolve_habit(source_ref)
     target = resolve_habit(target_ref)
     merge_habit(source, target)
-    print(f"{ansi.dim(source.content)} merged into {target.content.lower()}")
+    print(f"{ansi.dim(source.content)} merged into {target.content_lower}")
 
 
 def _render_habit_matrix(habits: list[Habit]) -> str:
@@ -408,14 +411,13 @@ def _render_habit_matrix(habits: list[Habit]) -> str:
         header = "habit           " + " ".join(day_names) + "   key"
         lines += [header, "-" * len(header)]
 
-        for h in sorted(daily, key=lambda h: h.content.lower()):
-            check_dates = {dt.date() for dt in h.checks}
-            is_vice = "vice" in (h.tags or [])
-            indicators = [
-                ("○" if d in check_dates else "●") if is_vice else ("●" if d in check_dates else "○") for d in dates
-            ]
-            cells = "   ".join(indicators)
-            lines.append(f"{h.content.lower():<15} {cells}   {muted}[{h.id[:8]}]{reset}")
+        window_start = dates[0]
+        for h in sorted(daily, key=lambda h: h.content_lower):
+            # only the 7-day window matters; skip hashing the rest of the history
+            check_dates = {d for dt in h.checks if (d := dt.date()) >= window_start}
+            hit, miss = ("○", "●") if "vice" in (h.tags or []) else ("●", "○")
+            cells = "   ".join([hit if d in check_dates else miss for d in dates])
+            lines.append(f"{h.content_lower:<15} {cells}   {muted}[{h.id8}]{reset}")
 
     if weekly:
         if daily:
@@ -432,14 +434,14 @@ def _render_habit_matrix(habits: list[Habit]) -> str:
         week_labels = [f"w{i + 1}" for i in range(4)]
         header = "habit           " + "  ".join(f"{w:>3}" for w in week_labels) + "   key"
         lines += [header, "-" * len(header)]
-        for h in sorted(weekly, key=lambda h: h.content.lower()):
-            check_dates = {dt.date() for dt in h.checks}
-            indicators = []
-            for start, end in week_ranges:
-                hit = any(start <= d <= end for d in check_dates)
-                indicators.append(" ● " if hit else " ○ ")
-            cells = "  ".join(indicators)
-            lines.append(f"{h.content.lower():<15} {cells}   {muted}[{h.id[:8]}]{reset}")
+        window_start = week_ranges[0][0]
+        for h in sorted(weekly, key=lambda h: h.content_lower):
+            # every range starts on a monday, so a check hits the range keyed by its own week's monday
+            weeks_hit = {
+                d - timedelta(days=d.weekday()) for dt in h.checks if window_start <= (d := dt.date()) <= today
+            }
+            cells = "  ".join([" ● " if start in weeks_hit else " ○ " for start, _ in week_ranges])
+            lines.append(f"{h.content_lower:<15} {cells}   {muted}[{h.id8}]{reset}")
 
     return "\n".join(lines)
 
@@ -2,7 +2,7 @@ import json
 import math
 from collections import defaultdict
 from dataclasses import dataclass
-from datetime import UTC, date, datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from fncli import cli
@@ -216,79 +216,40 @@ def weekly_momentum():
     """Get weekly totals: this week, last week, prior week"""
     today = clock.today()
 
-    this_week_start = today - timedelta(days=6)
-    this_week_end = today
+    windows = [
+        ("this_week", today - timedelta(days=6), today),
+        ("last_week", today - timedelta(days=13), today - timedelta(days=7)),
+        ("prior_week", today - timedelta(days=20), today - timedelta(days=14)),
+    ]
+
+    # one scan per table: each window becomes a pair of conditional counts instead of its own query
+    task_cols: list[str] = []
+    task_params: list[str] = []
+    check_cols: list[str] = []
+    check_params: list[str] = []
+    for _, start_date, end_date in windows:
+        start_str, end_str = start_date.isoformat(), end_date.isoformat()
+        task_cols.append("COUNT(CASE WHEN completed_at >= ? AND completed_at <= ? THEN 1 END)")
+        task_cols.append("COUNT(CASE WHEN created <= ? OR (completed_at >= ? AND completed_at <= ?) THEN 1 END)")
+        task_params.extend((start_str, end_str, end_str, start_str, end_str))
+        check_cols.append("COUNT(CASE WHEN check_date >= ? AND check_date <= ? THEN 1 END)")
+        check_params.extend((start_str, end_str))
 
-    last_week_start = today - timedelta(days=13)
-    last_week_end = today - timedelta(days=7)
-
-    prior_week_start = today - timedelta(days=20)
-    prior_week_end = today - timedelta(days=14)
+    with get_db() as conn:
+        task_counts = conn.execute(f"SELECT {', '.join(task_cols)} FROM tasks", task_params).fetchone()
+        check_counts = conn.execute(
+            f"SELECT {', '.join(check_cols)} FROM habit_checks WHERE check_date >= ? AND check_date <= ?",
+            (*check_params, windows[-1][1].isoformat(), windows[0][2].isoformat()),
+        ).fetchone()
+        active_habits_data = conn.execute("SELECT id, created, cadence FROM habits").fetchall()
 
     weeks = {}
-
-    with get_db() as conn:
-        for week_name, start_date, end_date in [
-            ("this_week", this_week_start, this_week_end),
-            ("last_week", last_week_start, last_week_end),
-            ("prior_week", prior_week_start, prior_week_end),
-        ]:
-            start_str = start_date.isoformat()
-            end_str = end_date.isoformat()
-            cursor = conn.execute(
-                """
-                SELECT COUNT(*)
-                FROM tasks
-                WHERE completed_at >= ?
-                AND completed_at <= ?
-                AND completed_at IS NOT NULL""",
-                (start_str, end_str),
-            )
-            tasks = cursor.fetchone()[0]
-
-            cursor = conn.execute(
-                """
-                SELECT COUNT(*)
-                FROM habit_checks c
-                WHERE c.check_date >= ?
-                AND c.check_date <= ?""",
-                (start_str, end_str),
-            )
-            habits = cursor.fetchone()[0]
-
-            cursor = conn.execute(
-                """
-                SELECT COUNT(*)
-                FROM tasks
-                WHERE (
-                    created <= ?
-                    OR (completed_at >= ? AND completed_at <= ?)
-                )""",
-                (end_str, start_str, end_str),
-            )
-            tasks_total = cursor.fetchone()[0]
-
-            cursor = conn.execute(
-                """
-                SELECT DISTINCT
-                    h.id,
-                    h.created,
-                    h.cadence
-                FROM habits h"""
-            )
-            active_habits_data = cursor.fetchall()
-
-            habits_total_possible = _calculate_total_possible(
-                active_habits_data,
-                date.fromisoformat(start_str),
-                date.fromisoformat(end_str),
-            )
-
-            weeks[week_name] = Weekly(
-                tasks_completed=tasks,
-                tasks_total=tasks_total,
-                habits_completed=habits,
-                habits_total=habits_total_possible,
-            )
+    for n, (week_name, start_date, end_date) in enumerate(windows):
+        weeks[week_name] = Weekly(
+            tasks_completed=task_counts[2 * n],
+            tasks_total=task_counts[2 * n + 1],
+            habits_completed=check_counts[n],
+            habits_total=_calculate_total_possible(active_habits_data, start_date, end_date),
+        )
 
     return weeks
@@ -61,7 +61,7 @@ def get_tasks_by_tag(tag: str) -> list[Task]:
             """
             SELECT DISTINCT t.id, t.content, t.focus, t.scheduled_date,
                    t.created, t.completed_at, t.parent_id, t.scheduled_time,
-                   t.blocked_by, t.notes, t.steward, t.source, t.is_deadline
+                   t.blocked_by, t.notes, t.steward, t.source, t.is_deadline, t.is_urgent
             FROM tasks t
             INNER JOIN tags tg ON t.id = tg.task_id
             WHERE tg.tag = ?
@@ -10,7 +10,7 @@ from life.task.render import render_task_detail
 from lifeos.core.errors import ConflictError, ValidationError
 from lifeos.core.lib import ansi, clock
 from lifeos.core.lib.clock import today
-from lifeos.core.lib.format import format_task, render_row
+from lifeos.core.lib.format import build_due_cache, format_row, format_task, render_row, write_rows
 from lifeos.core.lib.parsing import parse_due_and_item
 from lifeos.core.types import UNSET
 
@@ -299,9 +299,11 @@ def unschedule(ref: list[str] | None = None, overdue: bool = False) -> None:
         if not tasks:
             print("No overdue tasks.")
             return
+        rows = []
         for t in tasks:
             update_task(t.id, scheduled_date=None, scheduled_time=None, is_deadline=False)
-            render_row(t.content, t.tags, t.id)
+            rows.append(format_row(t.content, t.tags, t.id))
+        write_rows(rows)
         return
 
     if not ref:
@@ -329,8 +331,9 @@ def task(
         if not tasks:
             print("no tasks")
         else:
+            due_cache = build_due_cache(t.scheduled_date for t in tasks)
             for t in tasks:
-                print(f"  \u25a1 {format_task(t, tags=t.tags, show_id=True)}")
+                print(f"  \u25a1 {format_task(t, tags=t.tags, show_id=True, due_cache=due_cache)}")
         return
 
     # Try to resolve as existing task — if found, update it instead of creating
@@ -29,10 +29,16 @@ from lifeos.core.lib.parsing import parse_due_datetime, validate_content
 from lifeos.core.models import Task
 
 
+def _join_ref(words: list[str]) -> str:
+    if not words:
+        return ""
+    return words[0] if len(words) == 1 else " ".join(words)
+
+
 @cli("life", name="done", flags={"date": ["-d", "--date"], "time": ["-t", "--time"]})
 def check(ref: list[str], date: str | None = None, time: str | None = None, repeat: bool = False) -> None:
     """Toggle done"""
-    item_ref = " ".join(ref) if ref else ""
+    item_ref = _join_ref(ref)
     if not item_ref:
         raise UsageError("Usage: life check <item>")
 
@@ -52,9 +58,7 @@ def check(ref: list[str], date: str | None = None, time: str | None = None, repe
             return
         if not habit:
             raise UsageError("item not found")
-        checks = get_checks(habit.id)
-        already_checked = any(c.date() == check_on for c in checks)
-        if already_checked:
+        if check_on in {c.date() for c in get_checks(habit.id)}:
             uncheck_habit(habit.id, check_on=check_on)
             render_uncheck_row(f"{habit.content.lower()} ({parsed})", habit.tags, habit.id, is_habit=True)
         else:
@@ -71,14 +75,10 @@ def check(ref: list[str], date: str | None = None, time: str | None = None, repe
     task, habit = resolve_item_any(item_ref)
     if habit:
         today_date = today()
-        checks = get_checks(habit.id)
-        checked_today = any(c.date() == today_date for c in checks)
-        if checked_today:
+        if today_date in {c.date() for c in get_checks(habit.id)}:
             updated = toggle_check(habit.id)
-            if updated:
-                checked_today = any(c.date() == today() for c in updated.checks)
-                if not checked_today:
-                    render_uncheck_row(habit.content.lower(), habit.tags, habit.id, is_habit=True)
+            if updated and today_date not in {c.date() for c in updated.checks}:
+                render_uncheck_row(habit.content.lower(), habit.tags, habit.id, is_habit=True)
         else:
             check_habit_cmd(habit, check_time=time)
     elif task:
@@ -111,7 +111,7 @@ def add(
     source: str | None = None,
 ) -> None:
     """Add task or habit (--habit)"""
-    content_str = " ".join(content) if content else ""
+    content_str = _join_ref(content)
     try:
         validate_content(content_str)
     except ValueError as e:
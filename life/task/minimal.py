@@ -4,7 +4,6 @@ from datetime import date, timedelta
 
 from life.task.rows import RenderCtx, habit_sort_key, row_daily_habit, row_task
 from life.task.sections import section_done_today, section_header, section_overdue, section_schedule, section_vices
-from lifeos.core.lib import clock
 from lifeos.core.lib.ansi import bold, gold, gray, purple, theme
 from lifeos.core.lib.dates import upcoming_dates
 from lifeos.core.lib.format import fmt_time
@@ -35,13 +34,11 @@ def _habits(all_habits: list[Habit], checked_ids: set[str], ctx: RenderCtx) -> l
     return lines
 
 
-def _today(ctx: RenderCtx, today_str: str, events: list[dict[str, object]]) -> list[str]:
-    now_dt = clock.now()
+def _today(ctx: RenderCtx, due_today: list[Task], events: list[dict[str, object]]) -> list[str]:
+    now_dt = ctx.now
     now_time = now_dt.strftime("%H:%M")
     now_display = fmt_time(now_dt)
 
-    due_today = [t for t in ctx.pending if t.scheduled_date and t.scheduled_date.isoformat() == today_str]
-
     rows: list[tuple[str, list[str]]] = []
     for task in due_today:
         t_str = _pad_hm(task.scheduled_time) if task.scheduled_time else "zz:zz"
@@ -90,13 +87,13 @@ def render_minimal(
 
     today_habit_items = [i for i in (today_items or []) if isinstance(i, Habit)]
     checked_ids = {i.id for i in today_habit_items}
-    all_habits = list({h.id: h for h in habits + today_habit_items}.values())
+    all_habits = list({h.id: h for group in (habits, today_habit_items) for h in group}.values())
 
-    today_str = ctx.today.isoformat()
-    due_today_ids = {t.id for t in ctx.pending if t.scheduled_date and t.scheduled_date.isoformat() == today_str}
+    due_today = [t for t in ctx.pending if t.scheduled_date == ctx.today]
+    due_today_ids = {t.id for t in due_today}
 
     lines: list[str] = []
-    lines += section_header(ctx.today, tasks_today, habits_today, total_habits, added_today, deleted_today)
+    lines += section_header(ctx, tasks_today, habits_today, total_habits, added_today, deleted_today)
     lines += section_done_today(ctx, today_items or [], all_habits, checked_ids, due_today_ids)
     lines += _habits(all_habits, checked_ids, ctx)
     lines += section_vices(all_habits, checked_ids, ctx)
@@ -108,10 +105,10 @@ def render_minimal(
         overdue_lines, _ = section_overdue(overdue, ctx)
         lines += overdue_lines
 
-    lines += _today(ctx, today_str, upcoming_by_date.get(ctx.today, []))
+    lines += _today(ctx, due_today, upcoming_by_date.get(ctx.today, []))
 
     tomorrow = ctx.today + timedelta(days=1)
-    due_tomorrow = [t for t in ctx.pending if t.scheduled_date and t.scheduled_date == tomorrow]
+    due_tomorrow = [t for t in ctx.pending if t.scheduled_date == tomorrow]
     tomorrow_lines, _ = section_schedule(due_tomorrow, "TOMORROW", ctx, events=upcoming_by_date.get(tomorrow, []))
     lines += tomorrow_lines
 
@@ -6,7 +6,6 @@ from life.task import task_sort_key
 from life.task.minimal import render_minimal
 from life.task.rows import (
     RenderCtx,
-    fmt_tags,
     get_direct_tags,
     get_trend,
     row_task,
@@ -21,7 +20,6 @@ from life.task.sections import (
     section_schedule,
     section_vices,
 )
-from lifeos.core.lib import clock
 from lifeos.core.lib.ansi import bold, dim, gold, gray, green, purple, red, theme, white
 from lifeos.core.lib.dates import upcoming_dates
 from lifeos.core.lib.format import fmt_time
@@ -48,20 +46,17 @@ def _pad_hm(t: str) -> str:
 
 def _section_today_outstanding(
     ctx: RenderCtx,
-    all_habits: list[Habit],
-    checked_ids: set[str],
-    today_str: str,
+    due_today: list[Task],
     events: list[dict[str, object]],
 ) -> tuple[list[str], set[str]]:
     """Outstanding today: untimed-checked habits skipped, only what's left + now-marker."""
-    now_dt = clock.now()
+    now_dt = ctx.now
     now_time = now_dt.strftime("%H:%M")
     now_display = fmt_time(now_dt)
 
     timed: list[tuple[str, int, list[str]]] = []
     scheduled_ids: set[str] = set()
 
-    due_today = [t for t in ctx.pending if t.scheduled_date and t.scheduled_date.isoformat() == today_str]
     for task in due_today:
         t_str = _pad_hm(task.scheduled_time) if task.scheduled_time else "zz:zz"
         rows = row_task(task, ctx, {}, show_date=False, show_parent=True)
@@ -109,24 +104,37 @@ def render_dashboard(
         ev_date = ctx.today + timedelta(days=ev["days_until"])
         upcoming_by_date.setdefault(ev_date, []).append(ev)
 
-    today_habit_items = [i for i in (today_items or []) if isinstance(i, Habit)]
+    today_habit_items: list[Habit] = []
+    completed_subs: dict[str, list[Task]] = {}
+    for i in today_items or []:
+        if isinstance(i, Habit):
+            today_habit_items.append(i)
+        elif i.parent_id:
+            completed_subs.setdefault(i.parent_id, []).append(i)
     checked_ids = {i.id for i in today_habit_items}
-    all_habits = list({h.id: h for h in habits + today_habit_items}.values())
+    all_habits = list({h.id: h for group in (habits, today_habit_items) for h in group}.values())
 
     lines: list[str] = []
-    lines += section_header(ctx.today, tasks_today, habits_today, total_habits, added_today, deleted_today)
+    lines += section_header(ctx, tasks_today, habits_today, total_habits, added_today, deleted_today)
+
+    # one pass buckets pending by date; each section below is a dict lookup, not a rescan
+    pending_by_date: dict[date, list[Task]] = {}
+    overdue: list[Task] = []
+    for t in ctx.pending:
+        if not t.scheduled_date:
+            continue
+        if t.scheduled_date < ctx.today:
+            if t.id not in ctx.subtask_ids:
+                overdue.append(t)
+        else:
+            pending_by_date.setdefault(t.scheduled_date, []).append(t)
 
-    today_str = ctx.today.isoformat()
-    due_today_ids = {t.id for t in ctx.pending if t.scheduled_date and t.scheduled_date.isoformat() == today_str}
+    due_today = pending_by_date.get(ctx.today, [])
+    due_today_ids = {t.id for t in due_today}
     lines += section_done_today(ctx, today_items or [], all_habits, checked_ids, due_today_ids)
-    today_lines, scheduled_ids = _section_today_outstanding(
-        ctx, all_habits, checked_ids, today_str, upcoming_by_date.get(ctx.today, [])
-    )
+    today_lines, scheduled_ids = _section_today_outstanding(ctx, due_today, upcoming_by_date.get(ctx.today, []))
     lines += today_lines
 
-    overdue = [
-        t for t in ctx.pending if t.scheduled_date and t.scheduled_date < ctx.today and t.id not in ctx.subtask_ids
-    ]
     if overdue:
         overdue_lines, overdue_ids = section_overdue(overdue, ctx)
         lines += overdue_lines
@@ -143,19 +151,14 @@ def render_dashboard(
             label = day.strftime("%A").upper()
         else:
             label = day.strftime("%-d %b").upper()
-        due_day = [t for t in ctx.pending if t.scheduled_date and t.scheduled_date == day]
-        day_lines, day_ids = section_schedule(due_day, label, ctx, events=upcoming_by_date.get(day, []))
+        day_lines, day_ids = section_schedule(
+            pending_by_date.get(day, []), label, ctx, events=upcoming_by_date.get(day, [])
+        )
         lines += day_lines
         scheduled_ids |= day_ids
 
-    completed_today_tasks = [i for i in (today_items or []) if isinstance(i, Task)]
-    completed_subs: dict[str, list[Task]] = {}
-    for t in completed_today_tasks:
-        if t.parent_id:
-            completed_subs.setdefault(t.parent_id, []).append(t)
-
     ctx.scheduled_ids = scheduled_ids
-    backlog = [i for i in items if isinstance(i, Task) and i.id not in scheduled_ids and i.id not in ctx.subtask_ids]
+    backlog = [t for t in ctx.pending if t.id not in scheduled_ids and t.id not in ctx.subtask_ids]
     lines += section_backlog(backlog, ctx, completed_subs)
 
     return "\n".join(lines) + "\n"
@@ -206,13 +209,11 @@ def render_momentum(momentum: dict[str, Weekly]) -> str:
         lines.append(f"  {week_name.replace('_', ' ')}:")
         lines.append(f"    tasks: {w.tasks_completed}/{w.tasks_total} ({tasks_rate:.0f}%)")
         lines.append(f"    habits: {w.habits_completed}/{w.habits_total} ({habits_rate:.0f}%)")
-    if "this_week" in momentum and "last_week" in momentum:
-        lines.append(f"\n{bold(white('TRENDS (vs. Last Week):'))}")
-        tw, lw = momentum["this_week"], momentum["last_week"]
-        task_trend = get_trend(tw.tasks_completed, lw.tasks_completed)
-        habit_trend = get_trend(tw.habits_completed, lw.habits_completed)
-        lines.append(f"  Tasks: {task_trend}")
-        lines.append(f"  Habits: {habit_trend}")
+    # the loop above already required both weeks, so the trend block needs no membership checks
+    tw, lw = momentum["this_week"], momentum["last_week"]
+    lines.append(f"\n{bold(white('TRENDS (vs. Last Week):'))}")
+    lines.append(f"  Tasks: {get_trend(tw.tasks_completed, lw.tasks_completed)}")
+    lines.append(f"  Habits: {get_trend(tw.habits_completed, lw.habits_completed)}")
     return "\n".join(lines)
 
 
@@ -223,11 +224,11 @@ def _block_task(
     mutations: list[TaskMutation] | None = None,
     indent: str = "",
 ) -> list[str]:
-    tags_str = fmt_tags(task.tags, ctx.tag_colors)
+    tags_str = ctx.tag_str(task.tags)
     focus_str = f"{theme.bold}→{_R} " if task.focus else ""
     fire_str = f"{theme.bold}🔥{_R} " if task.is_urgent else ""
     status = gray("✓") if task.completed_at else "□"
-    lines = [f"{indent}{status} {focus_str}{fire_str}{dim('[' + task.id[:8] + ']')}  {task.content.lower()}{tags_str}"]
+    lines = [f"{indent}{status} {focus_str}{fire_str}{dim('[' + task.id8 + ']')}  {task.content_lower}{tags_str}"]
 
     if task.scheduled_date:
         label = "deadline" if task.is_deadline else "scheduled"
@@ -242,10 +243,10 @@ def _block_task(
 
     for sub in sorted(subtasks, key=task_sort_key):
         sub_status = gray("✓") if sub.completed_at else "□"
-        sub_tags_str = fmt_tags(get_direct_tags(sub, ctx.pending), ctx.tag_colors)
+        sub_tags_str = ctx.tag_str(get_direct_tags(sub, ctx.pending_by_id))
         time_str = f"{dim(fmt_time(sub.scheduled_time))} " if sub.scheduled_time else ""
         lines.append(
-            f"{indent}  └ {sub_status} {dim('[' + sub.id[:8] + ']')}  {time_str}{sub.content.lower()}{sub_tags_str}"
+            f"{indent}  └ {sub_status} {dim('[' + sub.id8 + ']')}  {time_str}{sub.content_lower}{sub_tags_str}"
         )
 
     deferrals = [m for m in (mutations or []) if m.field == "defer" or m.reason == "overdue_reset"]
@@ -26,7 +26,7 @@ def search_tasks(query: str, limit: int = 20) -> list[SearchResult]:
             """
             SELECT t.id, t.content, t.focus, t.scheduled_date, t.created, t.completed_at,
                    t.parent_id, t.scheduled_time, t.blocked_by, t.notes,
-                   t.steward, t.source, t.is_deadline,
+                   t.steward, t.source, t.is_deadline, t.is_urgent,
                    fts.rank
             FROM tasks_fts fts
             JOIN tasks t ON fts.rowid = t.rowid
@@ -39,7 +39,7 @@ def search_tasks(query: str, limit: int = 20) -> list[SearchResult]:
 
         results = []
         for row in rows:
-            task = row_to_task(row)
+            task = row_to_task(row[:-1])
             results.append(SearchResult(id=task.id, content=task.content, type="task", rank=row[-1], task=task))
         return results
 
@@ -102,7 +102,7 @@ def search_by_tag(tag: str, limit: int = 20) -> list[SearchResult]:
             """
             SELECT t.id, t.content, t.focus, t.scheduled_date, t.created, t.completed_at,
                    t.parent_id, t.scheduled_time, t.blocked_by, t.notes,
-                   t.steward, t.source, t.is_deadline,
+                   t.steward, t.source, t.is_deadline, t.is_urgent,
                    0.0 as rank
             FROM tasks t
             JOIN tags tg ON t.id = tg.task_id
@@ -113,7 +113,7 @@ def search_by_tag(tag: str, limit: int = 20) -> list[SearchResult]:
 
         results = []
         for row in rows:
-            task = row_to_task(row)
+            task = row_to_task(row[:-1])
             results.append(SearchResult(id=task.id, content=task.content, type="task", rank=0.0, task=task, tag=tag))
 
         habit_rows = conn.execute(
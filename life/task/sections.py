@@ -1,11 +1,10 @@
 """Dashboard section renderers — compose rows into labeled blocks."""
 
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 
 from life.task import task_sort_key
 from life.task.rows import (
     RenderCtx,
-    fmt_tags,
     get_tag_order,
     habit_sort_key,
     primary_tag,
@@ -14,7 +13,6 @@ from life.task.rows import (
     row_task,
     row_vice,
 )
-from lifeos.core.lib import clock
 from lifeos.core.lib.ansi import bold, dim, gold, gray, green, purple, red, theme, white
 from lifeos.core.lib.format import fmt_time
 from lifeos.core.lib.tags import load_tag_groups
@@ -33,11 +31,19 @@ _EVENT_EMOJI: dict[str, str] = {
 }
 
 
+def _latest_on(habit: Habit, day: date) -> datetime | None:
+    """Latest check on day; done habits are usually checked last on that day, which skips the scan."""
+    latest = habit.latest_check
+    if latest is None or latest.date() == day:
+        return latest
+    return max((c for c in habit.checks if c.date() == day), default=None)
+
+
 def section_header(
-    today: date, tasks_done: int, habits_done: int, total_habits: int, added: int, deleted: int
+    ctx: RenderCtx, tasks_done: int, habits_done: int, total_habits: int, added: int, deleted: int
 ) -> list[str]:
-    time_str = fmt_time(clock.now())
-    header = today.strftime("%a") + " · " + today.strftime("%-d %b %Y") + " · " + time_str
+    today = ctx.today
+    header = today.strftime("%a") + " · " + today.strftime("%-d %b %Y") + " · " + fmt_time(ctx.now)
     lines = [f"\n{bold(white(header))}"]
     lines.append(f"{_GREY}done:{_R} {green(str(tasks_done))}{_GREY}+{_R}{purple(str(habits_done))}")
     if added:
@@ -61,28 +67,25 @@ def section_done(
         if isinstance(item, Task) and item.completed_at:
             return item.completed_at
         if isinstance(item, Habit) and item.checks:
-            day_checks = [c for c in item.checks if c.date() == target]
-            if day_checks:
-                return max(day_checks)
-            return max(item.checks)
+            return _latest_on(item, target) or item.latest_check or item.created
         return item.created
 
     lines = [bold(green(f"DONE ({len(items)})"))] if show_header else []
     for item in sorted(items, key=_sort_key):
-        tags_str = fmt_tags(item.tags, ctx.tag_colors)
-        content = item.content.lower()
-        id_str = f" {dim('[' + item.id[:8] + ']')}"
+        tags_str = ctx.tag_str(item.tags)
+        content = item.content_lower
+        id_str = f" {dim('[' + item.id8 + ']')}"
         if isinstance(item, Habit):
-            on_date = [c for c in item.checks if c.date() == target]
-            time_str = fmt_time(max(on_date)) if on_date else ""
+            on_date = _latest_on(item, target)
+            time_str = fmt_time(on_date) if on_date else ""
             lines.append(f"  {purple('●')} {_GREY}{time_str}{_R} {content}{tags_str}{id_str}")
         elif item.completed_at:
             time_str = fmt_time(item.completed_at)
             parent_str = ""
             if item.parent_id:
-                parent = next((t for t in ctx.pending if t.id == item.parent_id), None)
+                parent = ctx.pending_by_id.get(item.parent_id)
                 if parent and not parent.completed_at:
-                    parent_str = f" {dim('→ ' + parent.content.lower())}"
+                    parent_str = f" {dim('→ ' + parent.content_lower)}"
             lines.append(f"  {green('✓')} {_GREY}{time_str}{_R} {content}{tags_str}{id_str}{parent_str}")
     return lines
 
@@ -102,7 +105,7 @@ def section_done_today(
     due_today_ids: set[str],
 ) -> list[str]:
     """Chronological log of what got done today — tasks completed + habits checked."""
-    now_time = clock.now().strftime("%H:%M")
+    now_time = ctx.now.strftime("%H:%M")
     entries: list[tuple[str, list[str]]] = []
 
     for task in (i for i in today_items if isinstance(i, Task) and i.completed_at):
@@ -110,24 +113,23 @@ def section_done_today(
             continue
         t_sort = task.completed_at.strftime("%H:%M")  # type: ignore[union-attr]
         t_disp = fmt_time(task.completed_at)  # type: ignore[union-attr]
-        tags_str = fmt_tags(task.tags, ctx.tag_colors)
-        id_str = f" {dim('[' + task.id[:8] + ']')}"
+        tags_str = ctx.tag_str(task.tags)
+        id_str = f" {dim('[' + task.id8 + ']')}"
         notes_marker = f" {dim('»')}" if task.id in ctx.noted_ids else ""
         entries.append(
-            (t_sort, [f"  {green('✓')} {gray(t_disp)} {task.content.lower()}{tags_str}{id_str}{notes_marker}"])
+            (t_sort, [f"  {green('✓')} {gray(t_disp)} {task.content_lower}{tags_str}{id_str}{notes_marker}"])
         )
 
     for habit in all_habits:
         if habit.private or habit.parent_id or "vice" in (habit.tags or []) or habit.id not in checked_ids:
             continue
-        day_checks = [c for c in habit.checks if c.date() == ctx.today]
-        check_dt = max(day_checks) if day_checks else None
+        check_dt = _latest_on(habit, ctx.today)
         t_str = check_dt.strftime("%H:%M") if check_dt else now_time
         t_disp = fmt_time(check_dt) if check_dt else now_time
-        tags_str = fmt_tags(habit.tags, ctx.tag_colors)
-        id_str = f" {dim('[' + habit.id[:8] + ']')}"
+        tags_str = ctx.tag_str(habit.tags)
+        id_str = f" {dim('[' + habit.id8 + ']')}"
         notes_marker = f" {dim('»')}" if habit.id in ctx.noted_ids else ""
-        row = f"  {purple('●')} {gray(t_disp)} {habit.content.lower()}{tags_str}{id_str}{notes_marker}"
+        row = f"  {purple('●')} {gray(t_disp)} {habit.content_lower}{tags_str}{id_str}{notes_marker}"
         entries.append((_pad_hm(t_str), [row]))
 
     if not entries:
@@ -205,7 +207,7 @@ def section_daily(habits: list[Habit], checked_ids: set[str], ctx: RenderCtx) ->
     done = [h for h in matching if h.id in checked_ids]
 
     if remaining or done:
-        for habit in sorted(remaining, key=lambda h: h.content.lower()) + sorted(done, key=lambda h: h.content.lower()):
+        for habit in sorted(remaining, key=lambda h: h.content_lower) + sorted(done, key=lambda h: h.content_lower):
             lines.extend(row_daily_habit(habit, checked_ids, ctx))
     else:
         lines.append(f"  {gray('all done.')}")
@@ -382,8 +384,8 @@ def section_vices(habits: list[Habit], checked_ids: set[str], ctx: RenderCtx) ->
         return []
     clean_count = sum(1 for h in vices if h.id not in checked_ids)
     lines = [f"\n{theme.bold}{theme.red}VICES ({clean_count}/{len(vices)}){_R}"]
-    clean = sorted([h for h in vices if h.id not in checked_ids], key=lambda h: h.content.lower())
-    used = sorted([h for h in vices if h.id in checked_ids], key=lambda h: h.content.lower())
+    clean = sorted([h for h in vices if h.id not in checked_ids], key=lambda h: h.content_lower)
+    used = sorted([h for h in vices if h.id in checked_ids], key=lambda h: h.content_lower)
     for vice in clean + used:
         lines.extend(row_vice(vice, checked_ids, ctx))
     return lines
@@ -396,11 +398,12 @@ def section_backlog(
 ) -> list[str]:
     if not tasks:
         return []
+    # resolve the tag order once; primary_tag would otherwise re-stat tags.toml per task
+    tag_order = get_tag_order()
     groups: dict[str, list[Task]] = {}
-    for task in sorted(tasks, key=lambda t: t.content.lower()):
-        groups.setdefault(primary_tag(task) or "", []).append(task)
+    for task in sorted(tasks, key=lambda t: t.content_lower):
+        groups.setdefault(primary_tag(task, tag_order) or "", []).append(task)
 
-    tag_order = get_tag_order()
     tag_labels = dict(load_tag_groups())
 
     # tags.toml [groups] is the viability contract — unknown tags collapse into OTHER
@@ -412,7 +415,7 @@ def section_backlog(
     if "" in groups:
         other.extend(groups.pop(""))
     if other:
-        groups[""] = sorted(other, key=lambda t: t.content.lower())
+        groups[""] = sorted(other, key=lambda t: t.content_lower)
 
     sections = [t for t in tag_order if t in groups]
     if "" in groups:
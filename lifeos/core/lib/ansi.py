@@ -1,14 +1,18 @@
 import re
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from zlib import crc32
 
 _ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+# bold runs as its own pass first so italic spans wrapping it (*a **b** c*) still match afterwards
 _MD_BOLD_RE = re.compile(r"\*\*([^*]+)\*\*")
-_MD_ITALIC_RE = re.compile(r"(?<!\*)\*([^*]+)\*(?!\*)")
-_MD_CODE_RE = re.compile(r"`([^`]+)`")
-_MD_HEADING_RE = re.compile(r"^#{1,6}\s+", re.MULTILINE)
-_MD_LINK_RE = re.compile(r"\[([^\]]+)\]\([^)]+\)")
+_MD_RE = re.compile(
+    r"(?<!\*)\*(?P<italic>[^*]+)\*(?!\*)"
+    r"|`(?P<code>[^`]+)`"
+    r"|\[(?P<link>[^\]]+)\]\([^)]+\)"
+)
+_MD_HEADING_RE = re.compile(r"#{1,6}\s+")
 
 
 @dataclass(frozen=True)
@@ -47,10 +51,15 @@ class Theme:
 DEFAULT = Theme()
 theme: Theme = DEFAULT
 
+# Hot-path escapes, rebound by use() so wrappers skip the theme attribute lookup.
+_bold, _dim, _muted, _reset = theme.bold, theme.dim, theme.muted, theme.reset
+
 
 def use(new_theme: Theme) -> None:
-    global theme
+    global theme, _bold, _dim, _muted, _reset
     theme = new_theme
+    _bold, _dim, _muted, _reset = theme.bold, theme.dim, theme.muted, theme.reset
+    _CODES.update({name: getattr(theme, name) for name in _COLORS})
 
 
 _COLORS = {
@@ -120,40 +129,73 @@ NAMED_COLORS: dict[str, str] = {name: code for code, name in POOL} | {
 }
 
 
-def __getattr__(name: str) -> Callable[[str], str]:
-    if name in _COLORS:
+_CODES: dict[str, str] = {name: getattr(theme, name) for name in _COLORS}
+
+
+def _color_wrapper(name: str) -> Callable[[str], str]:
+    def _wrap(text: str) -> str:
+        return _CODES[name] + text + _reset
+
+    _wrap.__name__ = name
+    return _wrap
 
-        def _wrap(text: str) -> str:
-            return f"{getattr(theme, name)}{text}{theme.reset}"
 
-        _wrap.__name__ = name
-        return _wrap
+# Built once and served by __getattr__ below; use() refreshes _CODES in place.
+_WRAPPERS = {name: _color_wrapper(name) for name in _COLORS}
+
+
+def __getattr__(name: str) -> Callable[[str], str]:
+    if name in _WRAPPERS:
+        return _WRAPPERS[name]
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def bold(text: str) -> str:
-    return f"{theme.bold}{text}{theme.reset}"
+    return _bold + text + _reset
 
 
 def dim(text: str) -> str:
-    return f"{theme.dim}{text}{theme.reset}"
+    return _dim + text + _reset
 
 
 def strikethrough(text: str) -> str:
     struck = "".join(c + "\u0336" for c in text)
-    return f"{theme.muted}{struck}{theme.reset}"
+    return _muted + struck + _reset
 
 
 def strip(text: str) -> str:
+    if "\x1b" not in text:
+        return text
+    return _strip_escapes(text)
+
+
+@lru_cache(maxsize=1024)
+def _strip_escapes(text: str) -> str:
     return _ANSI_RE.sub("", text)
 
 
 def strip_markdown(text: str) -> str:
-    text = _MD_BOLD_RE.sub(r"\1", text)
-    text = _MD_ITALIC_RE.sub(r"\1", text)
-    text = _MD_CODE_RE.sub(r"\1", text)
-    text = _MD_HEADING_RE.sub("", text)
-    return _MD_LINK_RE.sub(r"\1", text)
+    if "*" in text or "`" in text or "[" in text:
+        text = _strip_inline_md(text)
+    if "#" not in text:
+        return text
+    return "\n".join([_strip_heading(ln) if ln[:1] == "#" else ln for ln in text.split("\n")])
+
+
+def _strip_heading(line: str) -> str:
+    m = _MD_HEADING_RE.match(line)
+    return line[m.end() :] if m else line
+
+
+def _strip_inline_md(text: str) -> str:
+    if "**" in text:
+        text = _MD_BOLD_RE.sub(r"\1", text)
+    return _MD_RE.sub(_md_inner, text)
+
+
+def _md_inner(m: re.Match[str]) -> str:
+    kind = m.lastgroup
+    return _strip_inline_md(m.group(kind)) if kind else ""
 
 
 _REFERENCE_RE = re.compile(r"(?<![a-zA-Z0-9_.:/-])([a-z])/([a-f0-9]{8})(?![a-zA-Z0-9_])")
@@ -161,14 +203,18 @@ _MENTION_RE = re.compile(r"@(\w+)")
 
 _PATH_SEGMENT = r"[a-zA-Z0-9_.][a-zA-Z0-9_.-]*"
 _PATH_RE = re.compile(
-    rf"(?<![a-zA-Z0-9_.*:/])"
-    rf"("
-    rf"~/{_PATH_SEGMENT}(?:/{_PATH_SEGMENT})*"
-    rf"|\.\..?/{_PATH_SEGMENT}(?:/{_PATH_SEGMENT})*"
-    rf"|/{_PATH_SEGMENT}(?:/{_PATH_SEGMENT})+"
-    rf"|(?![itdr]/[a-f0-9]{{8}})[a-zA-Z0-9_][a-zA-Z0-9_.-]*(?:/{_PATH_SEGMENT})+"
-    rf")"
-    rf"(?![a-zA-Z0-9_])"
+    rf"""
+    (?<![a-zA-Z0-9_.*:/])
+    (
+        ~/{_PATH_SEGMENT}(?:/{_PATH_SEGMENT})*                 # ~/home-relative
+      | \.\..?/{_PATH_SEGMENT}(?:/{_PATH_SEGMENT})*              # ../parent-relative
+      | /{_PATH_SEGMENT}(?:/{_PATH_SEGMENT})+                  # /absolute
+      | (?![itdr]/[a-f0-9]{{8}})                              # not an item ref like t/abcdef12
+        [a-zA-Z0-9_][a-zA-Z0-9_.-]*(?:/{_PATH_SEGMENT})+      # relative/multi/segment
+    )
+    (?![a-zA-Z0-9_])
+    """,
+    re.VERBOSE,
 )
 
 _AGENT_COLORS: list[int] = [
@@ -211,31 +257,47 @@ _AGENT_COLORS: list[int] = [
 ]
 
 
+_AGENT_ANSI: tuple[str, ...] = tuple(f"\033[38;5;{c}m" for c in _AGENT_COLORS)
+
+
+@lru_cache(maxsize=512)
 def agent_color(identity: str) -> str:
-    lower = identity.lower()
-    idx = crc32(lower.encode()) % len(_AGENT_COLORS)
-    return f"\033[38;5;{_AGENT_COLORS[idx]}m"
+    return _AGENT_ANSI[crc32(identity.lower().encode()) % len(_AGENT_ANSI)]
+
+
+@lru_cache(maxsize=256)
+def _fold_sgr(a: str, b: str) -> str:
+    """Merge two SGR escapes into one sequence, e.g. ESC[1m + ESC[38;5;Nm -> ESC[1;38;5;Nm."""
+    if a.startswith("\033[") and a.endswith("m") and b.startswith("\033[") and b.endswith("m"):
+        return a[:-1] + ";" + b[2:]
+    return a + b
 
 
 def mention(name: str) -> str:
-    color = agent_color(name)
-    return f"{theme.bold}{color}@{name}{theme.reset}"
+    return _fold_sgr(_bold, agent_color(name)) + "@" + name + _reset
 
 
 def highlight_references(text: str, base_color: str | None = None) -> str:
-    base = base_color or theme.reset
+    if "/" not in text:
+        return text
+    reset = theme.reset
+    prefix = _fold_sgr(theme.bold, theme.cyan)
+    suffix = reset + (base_color or reset)
 
     def _color_ref(m: re.Match[str]) -> str:
-        return f"{theme.bold}{theme.cyan}{m.group(1)}/{m.group(2)}{theme.reset}{base}"
+        return prefix + m.group(0) + suffix
 
     return _REFERENCE_RE.sub(_color_ref, text)
 
 
 def highlight_path(text: str, base_color: str | None = None) -> str:
+    if "/" not in text:
+        return f"{base_color}{text}" if base_color else text
+    blue = theme.blue
     base = base_color or theme.reset
 
     def _color_path(m: re.Match[str]) -> str:
-        return f"{theme.blue}{m.group(1)}{base}"
+        return blue + m.group(0) + base
 
     result = _PATH_RE.sub(_color_path, text)
     if base_color:
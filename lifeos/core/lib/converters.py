@@ -1,5 +1,6 @@
 import dataclasses
 from datetime import date, datetime
+from functools import lru_cache
 from typing import TypeVar, cast
 
 from lifeos.core.models import Habit, Task
@@ -10,35 +11,40 @@ TaskRow = tuple[object, ...]
 HabitRow = tuple[object, ...]
 
 
+@lru_cache(maxsize=256)
+def _iso_date(val: str) -> date:
+    return date.fromisoformat(val.partition("T")[0])
+
+
+@lru_cache(maxsize=1024)
+def _iso_datetime(val: str) -> datetime:
+    try:
+        return datetime.fromisoformat(val)
+    except ValueError:
+        return datetime.combine(date.fromisoformat(val), datetime.min.time())
+
+
 def _parse_date(val) -> date | None:
     """Parse a date value that may be str or numeric timestamp."""
-    if isinstance(val, str) and val:
-        return date.fromisoformat(val.split("T")[0])
-    if isinstance(val, (int, float)):
+    kind = type(val)
+    if kind is str:
+        return _iso_date(val) if val else None
+    if kind is int or kind is float:
         return datetime.fromtimestamp(val).date()
     return None
 
 
 def _parse_datetime(val) -> datetime:
     """Parse a datetime value that may be str or numeric timestamp."""
-    if isinstance(val, (int, float)):
-        return datetime.fromtimestamp(val)
-    if isinstance(val, str) and val:
-        try:
-            return datetime.fromisoformat(val)
-        except ValueError:
-            return datetime.combine(date.fromisoformat(val), datetime.min.time())
-    return datetime.min
+    return _parse_datetime_optional(val) or datetime.min
 
 
 def _parse_datetime_optional(val) -> datetime | None:
     """Parse an optional datetime value that may be str or numeric timestamp."""
-    if isinstance(val, str) and val:
-        try:
-            return datetime.fromisoformat(val)
-        except ValueError:
-            return datetime.combine(date.fromisoformat(val), datetime.min.time())
-    elif isinstance(val, (int, float)):
+    kind = type(val)
+    if kind is str:
+        return _iso_datetime(val) if val else None
+    if kind is int or kind is float:
         return datetime.fromtimestamp(val)
     return None
 
@@ -50,33 +56,50 @@ def row_to_task(row: TaskRow) -> Task:
     completed, parent_id, scheduled_time, blocked_by, notes, steward,
     source, is_deadline, is_urgent)
     """
+    (
+        id_,
+        content,
+        focus,
+        scheduled_date,
+        created,
+        completed_at,
+        parent_id,
+        scheduled_time,
+        blocked_by,
+        notes,
+        steward,
+        source,
+        is_deadline,
+        is_urgent,
+    ) = row
     return Task(
-        id=cast(str, row[0]),
-        content=cast(str, row[1]),
-        focus=bool(row[2]),
-        scheduled_date=_parse_date(row[3]),
-        created=_parse_datetime(row[4]),
-        completed_at=_parse_datetime_optional(row[5]),
-        parent_id=cast(str, row[6]) if row[6] is not None else None,
-        scheduled_time=cast(str, row[7]) if row[7] is not None else None,
-        blocked_by=cast(str, row[8]) if row[8] is not None else None,
-        notes=cast(str, row[9]) if row[9] is not None else None,
-        steward=bool(row[10]) if row[10] is not None else False,
-        source=cast(str, row[11]) if row[11] is not None else None,
-        is_deadline=bool(row[12]) if row[12] is not None else False,
-        is_urgent=bool(row[13]) if row[13] is not None else False,
+        id=cast(str, id_),
+        content=cast(str, content),
+        focus=bool(focus),
+        scheduled_date=_parse_date(scheduled_date),
+        created=_parse_datetime(created),
+        completed_at=_parse_datetime_optional(completed_at),
+        parent_id=cast(str | None, parent_id),
+        scheduled_time=cast(str | None, scheduled_time),
+        blocked_by=cast(str | None, blocked_by),
+        notes=cast(str | None, notes),
+        steward=bool(steward),
+        source=cast(str | None, source),
+        is_deadline=bool(is_deadline),
+        is_urgent=bool(is_urgent),
     )
 
 
 def row_to_habit(row: HabitRow) -> Habit:
+    id_, content, created, archived_at, parent_id, private, cadence = row
     return Habit(
-        id=cast(str, row[0]),
-        content=cast(str, row[1]),
-        created=_parse_datetime(row[2]),
-        archived_at=_parse_datetime_optional(row[3]),
-        parent_id=cast(str, row[4]) if row[4] is not None else None,
-        private=bool(row[5]) if row[5] is not None else False,
-        cadence=cast(str, row[6]) if len(row) > 6 and row[6] is not None else "daily",
+        id=cast(str, id_),
+        content=cast(str, content),
+        created=_parse_datetime(created),
+        archived_at=_parse_datetime_optional(archived_at),
+        parent_id=cast(str | None, parent_id),
+        private=bool(private),
+        cadence=cast(str, cadence) if cadence is not None else "daily",
     )
 
 
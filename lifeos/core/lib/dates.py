@@ -1,5 +1,5 @@
-import re
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 from dateutil import parser as dateutil_parser
@@ -21,36 +21,47 @@ def parse_created_date(created_val: int | float | str) -> date:
     return date.fromisoformat(created_val.split("T")[0])
 
 
+_RELATIVE_DAYS = {"yesterday": -1, "today": 0, "tomorrow": 1}
+_WEEKDAYS = {
+    "mon": 0,
+    "monday": 0,
+    "tue": 1,
+    "tuesday": 1,
+    "wed": 2,
+    "wednesday": 2,
+    "thu": 3,
+    "thursday": 3,
+    "fri": 4,
+    "friday": 4,
+    "sat": 5,
+    "saturday": 5,
+    "sun": 6,
+    "sunday": 6,
+}
+
+
+def is_hhmm(s: str) -> bool:
+    """Bare H:MM / HH:MM clock time."""
+    hours, sep, minutes = s.partition(":")
+    return bool(sep) and 1 <= len(hours) <= 2 and len(minutes) == 2 and hours.isdecimal() and minutes.isdecimal()
+
+
 def parse_due_date(due_str: str) -> str | None:
     """Parses a due date string (e.g., 'today', 'tomorrow', 'mon', 'YYYY-MM-DD')."""
-    due_str_lower = due_str.lower()
-    today = clock.today()
+    return _parse_due_date(due_str, clock.today())
+
 
-    if due_str_lower == "today":
-        return today.isoformat()
-    if due_str_lower == "yesterday":
-        return (today - timedelta(days=1)).isoformat()
-    if due_str_lower == "tomorrow":
-        return (today + timedelta(days=1)).isoformat()
-    _day_aliases = {
-        "monday": "mon",
-        "tuesday": "tue",
-        "wednesday": "wed",
-        "thursday": "thu",
-        "friday": "fri",
-        "saturday": "sat",
-        "sunday": "sun",
-    }
-    due_str_lower = _day_aliases.get(due_str_lower, due_str_lower)
-    if due_str_lower in ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]:
-        day_map = {"mon": 0, "tue": 1, "wed": 2, "thu": 3, "fri": 4, "sat": 5, "sun": 6}
-        current_weekday = today.weekday()
-        target_weekday = day_map[due_str_lower]
-        days_ahead = (target_weekday - current_weekday + 7) % 7
-        if days_ahead == 0 and due_str_lower != today.strftime("%a").lower():
-            days_ahead = 7
+@lru_cache(maxsize=256)
+def _parse_due_date(due_str: str, today: date) -> str | None:
+    due_str_lower = due_str.lower()
+    offset = _RELATIVE_DAYS.get(due_str_lower)
+    if offset is not None:
+        return (today + timedelta(days=offset)).isoformat()
+    target_weekday = _WEEKDAYS.get(due_str_lower)
+    if target_weekday is not None:
+        days_ahead = (target_weekday - today.weekday()) % 7
         return (today + timedelta(days=days_ahead)).isoformat()
-    if re.match(r"^\d{1,2}:\d{2}$", due_str.strip()):
+    if is_hhmm(due_str.strip()):
         return None
     try:
         return dateutil_parser.parse(due_str, default=datetime(today.year, today.month, today.day)).date().isoformat()
@@ -70,16 +81,24 @@ def _days_until(month: int, day: int, today: date) -> int:
 def list_dates() -> list[dict[str, Any]]:
     """Get all special dates from DB, sorted by next occurrence."""
     today = clock.today()
+    # Dates still ahead this year first, then those that wrap to next year; each group in calendar order.
     with get_db() as conn:
-        rows = conn.execute("SELECT id, name, month, day, type FROM special_dates ORDER BY name").fetchall()
-
-    result = []
-    for row in rows:
-        id_, name, month, day, type_ = row
-        days = _days_until(month, day, today)
-        result.append({"id": id_, "name": name, "month": month, "day": day, "type": type_, "days_until": days})
-
-    return sorted(result, key=lambda x: x["days_until"])
+        rows = conn.execute(
+            "SELECT id, name, month, day, type FROM special_dates ORDER BY (month * 100 + day) < ?, month, day, name",
+            (today.month * 100 + today.day,),
+        ).fetchall()
+
+    return [
+        {
+            "id": id_,
+            "name": name,
+            "month": month,
+            "day": day,
+            "type": type_,
+            "days_until": _days_until(month, day, today),
+        }
+        for id_, name, month, day, type_ in rows
+    ]
 
 
 def add_date(name: str, date_str: str, type_: str = "other") -> None:
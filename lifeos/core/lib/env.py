@@ -7,6 +7,7 @@ runtime code reads them here.
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
@@ -94,9 +95,17 @@ _API_KEY_FILE = Path.home() / ".life" / "api_key"
 
 def _read_api_key() -> str | None:
     """Read API key from file — no keychain, no password prompts, works over SSH."""
-    if _API_KEY_FILE.exists():
-        return _API_KEY_FILE.read_text().strip() or None
-    return None
+    try:
+        st = _API_KEY_FILE.stat()
+    except OSError:
+        return None
+    return _read_key_file(_API_KEY_FILE, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=4)
+def _read_key_file(path: Path, mtime_ns: int, size: int) -> str | None:
+    """One read per file version: rewriting the key changes its mtime or size."""
+    return path.read_text().strip() or None
 
 
 def build_base_env(spawn_mode: Mode) -> dict[str, str]:
@@ -1,30 +1,39 @@
 import sys
+from collections.abc import Iterable
 from datetime import UTC, date, datetime
+from functools import lru_cache
 
 from . import ansi
 from .ansi import NAMED_COLORS
 from .tags import load_tag_overrides
 
 __all__ = [
+    "build_due_cache",
     "fmt_time",
     "format_due",
     "format_elapsed",
     "format_habit",
+    "format_row",
     "format_status",
     "format_task",
     "render_done_row",
     "render_row",
     "render_uncheck_row",
+    "write_rows",
 ]
 
 
 def fmt_time(t: str | datetime) -> str:
     """Format time as '1:42', '10:00' — 24h, no leading zero."""
     if isinstance(t, datetime):
-        h, m = t.hour, t.minute
-    else:
-        parts = t.split(":")
-        h, m = int(parts[0]), int(parts[1])
+        return f"{t.hour}:{t.minute:02d}"
+    return _fmt_hm(t)
+
+
+@lru_cache(maxsize=256)
+def _fmt_hm(t: str) -> str:
+    parts = t.split(":")
+    h, m = int(parts[0]), int(parts[1])
     return f"{h}:{m:02d}"
 
 
@@ -54,19 +63,19 @@ def format_elapsed(dt: datetime, now: datetime | None = None) -> str:
     return dt.strftime("%Y-%m-%d")
 
 
+_POOL_CODES = tuple(code for code, _ in ansi.POOL)
+
+
 def _fmt_tags(tags: list[str]) -> str:
     """Format tags with consistent color-pool coloring (matches dashboard)."""
     if not tags:
         return ""
     r = ansi.theme.reset
-    pool = [code for code, _ in ansi.POOL]
-    all_tags = sorted(set(tags))
-    colors = {t: pool[i % len(pool)] for i, t in enumerate(all_tags)}
+    colors = {t: _POOL_CODES[i % len(_POOL_CODES)] for i, t in enumerate(sorted(set(tags)))}
     for tag, color_name in load_tag_overrides().items():
         if tag in colors and color_name in NAMED_COLORS:
             colors[tag] = NAMED_COLORS[color_name]
-    parts = [f"{colors[t]}#{t}{r}" for t in tags]
-    return " " + " ".join(parts)
+    return " " + " ".join([colors[t] + "#" + t + r for t in tags])
 
 
 def render_row(
@@ -79,13 +88,33 @@ def render_row(
     prefix: str = "  ",
 ) -> None:
     """Standardized row renderer. Used by all creation, check, and uncheck paths."""
+    write_rows([format_row(content, tags, item_id, symbol=symbol, time_str=time_str, prefix=prefix)])
+
+
+def format_row(
+    content: str,
+    tags: list[str],
+    item_id: str,
+    *,
+    symbol: str = "□",
+    time_str: str = "",
+    prefix: str = "  ",
+) -> str:
+    """The line render_row prints, without the trailing newline."""
     r = ansi.theme.reset
     grey = ansi.theme.muted
     tag_str = _fmt_tags(tags)
     id_str = f" {grey}[{item_id[:8]}]{r}"
     time_part = f"{grey}{time_str}{r} " if time_str else ""
-    sys.stdout.write(f"{prefix}{symbol} {time_part}{content}{tag_str}{id_str}\n")
-    sys.stdout.flush()
+    return f"{prefix}{symbol} {time_part}{content}{tag_str}{id_str}"
+
+
+def write_rows(rows: Iterable[str]) -> None:
+    """Emit pre-formatted rows with a single write and flush."""
+    out = "\n".join(rows)
+    if out:
+        sys.stdout.write(out + "\n")
+        sys.stdout.flush()
 
 
 def render_done_row(content: str, time_str: str, tags: list[str], item_id: str, is_habit: bool = False) -> None:
@@ -107,20 +136,29 @@ def _format_tags(tags: list[str]) -> str:
 def format_due(due_date: date | str, colorize: bool = True) -> str:
     if not due_date:
         return ""
+    label = _due_label(due_date)
+    if colorize:
+        return ansi.muted(label)
+    return label
 
-    if isinstance(due_date, str):
-        due = date.fromisoformat(due_date)
-    else:
-        due = due_date
 
-    date_str = due.strftime("%d/%m")
+@lru_cache(maxsize=256)
+def _due_label(due_date: date | str) -> str:
+    due = date.fromisoformat(due_date) if isinstance(due_date, str) else due_date
+    return f"{due.strftime('%d/%m')}·"
 
-    if colorize:
-        return ansi.muted(f"{date_str}·")
-    return f"{date_str}·"
+
+def build_due_cache(dates: Iterable[date | str | None]) -> dict[date | str, str]:
+    """Pre-render colorized due labels for a batch, keyed by the raw date value."""
+    return {d: format_due(d) for d in set(dates) if d}
 
 
-def format_task(task, tags: list[str] | None = None, show_id: bool = False) -> str:
+def format_task(
+    task,
+    tags: list[str] | None = None,
+    show_id: bool = False,
+    due_cache: dict[date | str, str] | None = None,
+) -> str:
     """Format a task for display. Returns: [⦿] [due] content [#tags] [id]"""
     parts = []
 
@@ -128,15 +166,16 @@ def format_task(task, tags: list[str] | None = None, show_id: bool = False) -> s
         parts.append(ansi.bold("⦿"))
 
     if task.scheduled_date:
-        parts.append(format_due(task.scheduled_date, colorize=True))
+        due = due_cache.get(task.scheduled_date) if due_cache is not None else None
+        parts.append(due or format_due(task.scheduled_date, colorize=True))
 
-    parts.append(task.content.lower())
+    parts.append(task.content_lower)
 
     if tags:
         parts.append(_format_tags(tags))
 
     if show_id:
-        parts.append(ansi.muted(f"[{task.id[:8]}]"))
+        parts.append(ansi.muted(f"[{task.id8}]"))
 
     return " ".join(parts)
 
@@ -150,13 +189,13 @@ def format_habit(habit, checked: bool = False, tags: list[str] | None = None, sh
     else:
         parts.append(ansi.purple("○"))
 
-    parts.append(habit.content.lower())
+    parts.append(habit.content_lower)
 
     if tags:
         parts.append(_format_tags(tags))
 
     if show_id:
-        parts.append(ansi.muted(f"[{habit.id[:8]}]"))
+        parts.append(ansi.muted(f"[{habit.id8}]"))
 
     return " ".join(parts)
 
@@ -1,5 +1,6 @@
+import heapq
 from collections.abc import Sequence
-from difflib import get_close_matches
+from difflib import SequenceMatcher
 from typing import TypeVar
 
 from lifeos.core.errors import AmbiguousError
@@ -11,58 +12,84 @@ FUZZY_MATCH_CUTOFF = 0.8
 
 T = TypeVar("T", Task, Habit)
 
+_HEX = frozenset("0123456789abcdef-")
 
-def _match_uuid_prefix[T: (Task, Habit)](ref: str, pool: Sequence[T]) -> T | None:
-    ref_lower = ref.lower()
-    matches = [item for item in pool if item.id[:8].startswith(ref_lower)]
+
+def _pick_uuid[T: (Task, Habit)](ref: str, matches: list[T]) -> T:
     if len(matches) == 1:
         return matches[0]
-    if len(matches) > 1:
-        exact = next((item for item in matches if item.id == ref), None)
-        if exact:
-            return exact
-
-        sample = [item.id[:8] for item in matches[:3]]
-        raise AmbiguousError(ref, count=len(matches), sample=sample)
-    return None
-
-
-def _match_substring[T: (Task, Habit)](ref: str, pool: Sequence[T]) -> T | None:
-    ref_lower = ref.lower()
-    exact = next((item for item in pool if item.content.lower() == ref_lower), None)
+    exact = next((item for item in matches if item.id == ref), None)
     if exact:
         return exact
-    matches = [item for item in pool if ref_lower in item.content.lower()]
+    sample = [item.id8 for item in matches[:3]]
+    raise AmbiguousError(ref, count=len(matches), sample=sample)
+
+
+def _pick_substring[T: (Task, Habit)](ref: str, matches: list[T]) -> T:
     if len(matches) == 1:
         return matches[0]
-    if len(matches) > 1:
-        sample = [item.content for item in matches[:3]]
-        raise AmbiguousError(ref, count=len(matches), sample=sample)
-    return None
+    sample = [item.content for item in matches[:3]]
+    raise AmbiguousError(ref, count=len(matches), sample=sample)
+
+
+def _match_fuzzy[T: (Task, Habit)](ref: str, ref_lower: str, pool: Sequence[T]) -> T | None:
+    """difflib.get_close_matches(n=10), scored by pool index so hits map straight back to items."""
+    matcher = SequenceMatcher()
+    matcher.set_seq2(ref_lower)
+    scored = []
+    for i, item in enumerate(pool):
+        matcher.set_seq1(item.content_lower)
+        if matcher.real_quick_ratio() < FUZZY_MATCH_CUTOFF or matcher.quick_ratio() < FUZZY_MATCH_CUTOFF:
+            continue
+        score = matcher.ratio()
+        if score >= FUZZY_MATCH_CUTOFF:
+            scored.append((score, -i))
+    if not scored:
+        return None
+    top = heapq.nlargest(10, scored)
+    if len(top) > 1:
+        hit = sorted(-i for _, i in top)
+        sample = [pool[i].content for i in hit[:3]]
+        raise AmbiguousError(ref, count=len(top), sample=sample)
+    return pool[-top[0][1]]
 
 
-def _match_fuzzy[T: (Task, Habit)](ref: str, pool: Sequence[T]) -> T | None:
+def _find[T: (Task, Habit)](ref: str, pool: Sequence[T], fuzzy: bool) -> T | None:
+    """One pass gathers uuid-prefix, exact-content and substring hits; priority is applied afterwards."""
     ref_lower = ref.lower()
-    contents = [item.content for item in pool]
-    matches = get_close_matches(ref_lower, [c.lower() for c in contents], n=10, cutoff=FUZZY_MATCH_CUTOFF)
-    if len(matches) > 1:
-        sample = [item.content for item in pool if item.content.lower() in matches][:3]
-        raise AmbiguousError(ref, count=len(matches), sample=sample)
-    if matches:
-        match_content = matches[0]
-        for item in pool:
-            if item.content.lower() == match_content:
-                return item
-    return None
+    # ids are uuid4: refs longer than the short id or with non-hex chars can never prefix one
+    id_ref = len(ref_lower) <= 8 and _HEX.issuperset(ref_lower)
+    uuid_hits: list[T] = []
+    exact: T | None = None
+    substr_hits: list[T] = []
+    for item in pool:
+        if id_ref and item.id8.startswith(ref_lower):
+            uuid_hits.append(item)
+        content_lower = item.content_lower
+        if ref_lower not in content_lower:
+            continue
+        # exact matches are a subset of substring hits, so misses pay for one test, not two
+        if content_lower == ref_lower:
+            if exact is None:
+                exact = item
+        else:
+            substr_hits.append(item)
+    if uuid_hits:
+        return _pick_uuid(ref, uuid_hits)
+    if exact is not None:
+        return exact
+    if substr_hits:
+        return _pick_substring(ref, substr_hits)
+    return _match_fuzzy(ref, ref_lower, pool) if fuzzy else None
 
 
 def find_in_pool[T: (Task, Habit)](ref: str, pool: Sequence[T]) -> T | None:
     if not pool:
         return None
-    return _match_uuid_prefix(ref, pool) or _match_substring(ref, pool) or _match_fuzzy(ref, pool)
+    return _find(ref, pool, fuzzy=True)
 
 
 def find_in_pool_exact[T: (Task, Habit)](ref: str, pool: Sequence[T]) -> T | None:
     if not pool:
         return None
-    return _match_uuid_prefix(ref, pool) or _match_substring(ref, pool)
+    return _find(ref, pool, fuzzy=False)
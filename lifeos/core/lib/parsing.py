@@ -1,7 +1,5 @@
-import re
-
 from . import clock
-from .dates import parse_due_date
+from .dates import is_hhmm, parse_due_date
 
 
 def validate_content(content: str) -> None:
@@ -14,11 +12,12 @@ def validate_content(content: str) -> None:
 
 
 def _try_parse_time(s: str) -> str | None:
-    m = re.match(r"^(\d{1,2}):(\d{2})$", s.strip().lower())
-    if m:
-        h, mn = int(m.group(1)), int(m.group(2))
-        if 0 <= h <= 23 and 0 <= mn <= 59:
-            return f"{h:02d}:{mn:02d}"
+    s = s.strip()
+    if not is_hhmm(s):
+        return None
+    h, mn = int(s[:-3]), int(s[-2:])
+    if h <= 23 and mn <= 59:
+        return f"{h:02d}:{mn:02d}"
     return None
 
 
@@ -62,12 +61,6 @@ def parse_due_and_item(args: list[str], remove: bool = False) -> tuple[str | Non
                 item_args = item_args[1:]
                 if not date_str:
                     date_str = clock.today().isoformat()
-            elif not date_str:
-                parsed_time2 = _try_parse_time(item_args[0])
-                if parsed_time2:
-                    time_str = parsed_time2
-                    date_str = clock.today().isoformat()
-                    item_args = item_args[1:]
 
         if not date_str and not time_str and len(item_args) > 1:
             last = item_args[-1]
@@ -96,13 +89,10 @@ def parse_due_and_item(args: list[str], remove: bool = False) -> tuple[str | Non
 
 
 def parse_time(time_str: str) -> str:
-    time_str = time_str.strip().lower()
-    m = re.match(r"^(\d{1,2}):(\d{2})$", time_str)
-    if m:
-        h, mn = int(m.group(1)), int(m.group(2))
-        if 0 <= h <= 23 and 0 <= mn <= 59:
-            return f"{h:02d}:{mn:02d}"
-    raise ValueError(f"Invalid time '{time_str}' — use HH:MM")
+    parsed = _try_parse_time(time_str)
+    if parsed:
+        return parsed
+    raise ValueError(f"Invalid time '{time_str.strip().lower()}' — use HH:MM")
 
 
 def parse_due_datetime(due_str: str) -> tuple[str | None, str | None]:
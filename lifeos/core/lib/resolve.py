@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 
 from lifeos.core.lib.frontmatter import parse as fm_parse
@@ -5,22 +6,33 @@ from lifeos.core.lib.frontmatter import parse as fm_parse
 _PEOPLE_DIR = Path.home() / "life" / "steward" / "people"
 
 
+def _profile_fm(profile: Path) -> dict[str, str]:
+    st = profile.stat()
+    return _parse_profile(profile, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=128)
+def _parse_profile(path: Path, mtime_ns: int, size: int) -> dict[str, str]:
+    """One parse per profile version: editing the file changes its mtime or size."""
+    return fm_parse(path.read_text())
+
+
 def resolve_people_field(name: str, field: str) -> str | None:
-    """Look up a field from people frontmatter by name or filename stem."""
+    """Look up a field from people frontmatter by filename stem, then by name."""
     if not _PEOPLE_DIR.exists():
         return None
     name_lower = name.lower()
-    for profile in _PEOPLE_DIR.glob("*.md"):
-        text = profile.read_text()
-        fm = fm_parse(text)
-        if not fm:
+    profiles = list(_PEOPLE_DIR.glob("*.md"))
+    # stems need no I/O; only read every profile when no filename matches
+    by_stem = [p for p in profiles if p.stem.lower() == name_lower]
+    for profile in by_stem:
+        if value := _profile_fm(profile).get(field):
+            return value
+    for profile in profiles:
+        if profile in by_stem:
             continue
+        fm = _profile_fm(profile)
         value = fm.get(field)
-        if not value:
-            continue
-        if profile.stem.lower() == name_lower:
-            return value
-        name_val = fm.get("name", "")
-        if name_val.lower() == name_lower:
+        if value and fm.get("name", "").lower() == name_lower:
             return value
     return None
@@ -1,5 +1,6 @@
 import os
 import tomllib
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -10,8 +11,16 @@ def _tags_path() -> Path:
 
 def _load_tags_toml() -> dict[str, object]:
     path = _tags_path()
-    if not path.exists():
+    try:
+        st = path.stat()
+    except OSError:
         return {}
+    return _parse_tags_toml(path, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=8)
+def _parse_tags_toml(path: Path, mtime_ns: int, size: int) -> dict[str, object]:
+    """Parsed once per file version; callers must treat the result as read-only."""
     try:
         with path.open("rb") as f:
             return tomllib.load(f)
@@ -1,5 +1,6 @@
 import dataclasses
 from datetime import date, datetime
+from functools import cached_property
 
 
 @dataclasses.dataclass(frozen=True)
@@ -20,6 +21,14 @@ class Task:
     source: str | None = None
     tags: list[str] = dataclasses.field(default_factory=list, hash=False)
 
+    @cached_property
+    def id8(self) -> str:
+        return self.id[:8]
+
+    @cached_property
+    def content_lower(self) -> str:
+        return self.content.lower()
+
 
 @dataclasses.dataclass(frozen=True)
 class Habit:
@@ -34,6 +43,18 @@ class Habit:
     checks: list[datetime] = dataclasses.field(default_factory=list, hash=False)
     tags: list[str] = dataclasses.field(default_factory=list, hash=False)
 
+    @cached_property
+    def id8(self) -> str:
+        return self.id[:8]
+
+    @cached_property
+    def content_lower(self) -> str:
+        return self.content.lower()
+
+    @cached_property
+    def latest_check(self) -> datetime | None:
+        return max(self.checks) if self.checks else None
+
 
 @dataclasses.dataclass(frozen=True)
 class Tag:
@@ -0,0 +1,4 @@
+CREATE INDEX IF NOT EXISTS idx_mutations_field_at ON mutations(field, mutated_at);
+DROP INDEX IF EXISTS idx_mutations_field;
+CREATE INDEX IF NOT EXISTS idx_mutations_reason_at ON mutations(reason, mutated_at) WHERE reason IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_moods_logged_at ON moods(logged_at DESC);
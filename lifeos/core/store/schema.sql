@@ -253,8 +253,10 @@ CREATE INDEX idx_tags_name ON tags(tag);
 CREATE UNIQUE INDEX idx_tags_task_unique ON tags(task_id, tag) WHERE task_id IS NOT NULL;
 CREATE UNIQUE INDEX idx_tags_habit_unique ON tags(habit_id, tag) WHERE habit_id IS NOT NULL;
 CREATE INDEX idx_mutations_task ON mutations(task_id);
-CREATE INDEX idx_mutations_field ON mutations(field);
 CREATE INDEX idx_mutations_at ON mutations(mutated_at);
+CREATE INDEX idx_mutations_field_at ON mutations(field, mutated_at);
+CREATE INDEX idx_mutations_reason_at ON mutations(reason, mutated_at) WHERE reason IS NOT NULL;
+CREATE INDEX idx_moods_logged_at ON moods(logged_at DESC);
 CREATE INDEX idx_tasks_deleted_at ON tasks(deleted_at) WHERE deleted_at IS NOT NULL;
 CREATE INDEX idx_observations_tag ON observations(tag) WHERE tag IS NOT NULL;
 CREATE INDEX idx_achievements_at ON achievements(achieved_at);
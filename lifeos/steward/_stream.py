@@ -2,11 +2,18 @@
 
 import json
 import re
+import sys
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 _ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
 _HOME = str(Path.home())
+# json.loads minus its per-call type/BOM checks; the decoder skips surrounding whitespace itself
+_decode_json = json.JSONDecoder().decode
+# calls whose results never arrive would otherwise pile up over a long session
+_TOOL_MAP_MAX = 1024
 
 
 def ansi_strip(text: str) -> str:
@@ -43,37 +50,62 @@ _TOOL_COLORS: dict[str, str] = {
     "cd": _GRAY,
 }
 
+# bold+colour prefix per known display name, built once instead of per tool call
+_TOOL_LABELS: dict[str, str] = {name: f"{_B}{color}{name}{_R}" for name, color in _TOOL_COLORS.items()}
+
 _TOOL_DISPLAY: dict[str, str] = {
     "MultiEdit": "edit",
     "WebFetch": "fetch",
     "WebSearch": "web",
 }
 
-_BASH_MAP: list[tuple[re.Pattern[str], str]] = [
-    (re.compile(r"^cd\b"), "cd"),
-    (re.compile(r"^git\b"), "git"),
-    (re.compile(r"^(ls|exa)\b"), "ls"),
-    (re.compile(r"^rg\b"), "grep"),
-    (re.compile(r"^curl\b"), "fetch"),
-    (re.compile(r"^uv\s+run\b"), "run"),
-    (re.compile(r"^python[23]?\b"), "run"),
-    (re.compile(r"^just\b"), "run"),
-]
+# tools whose display argument lives under a single key; everything else shows its path/pattern
+_TOOL_ARG_KEYS: dict[str, str] = {
+    "WebFetch": "url",
+    "WebSearch": "query",
+}
+
+# one alternation in priority order; the named group that matched picks the display name
+_BASH_RE = re.compile(
+    r"(?:(?P<cd>cd)|(?P<git>git)|(?P<ls>ls|exa)|(?P<grep>rg)|(?P<fetch>curl)"
+    r"|(?P<uv>uv\s+run)|(?P<python>python[23]?)|(?P<just>just))\b\s*"
+)
+_BASH_NAMES: dict[str, str] = {
+    "cd": "cd",
+    "git": "git",
+    "ls": "ls",
+    "grep": "grep",
+    "fetch": "fetch",
+    "uv": "run",
+    "python": "run",
+    "just": "run",
+}
 
 
 def _parse_bash(cmd: str) -> tuple[str, str]:
-    base = cmd.strip().split("\n")[0].replace(_HOME, "~")
-    for pat, name in _BASH_MAP:
-        if pat.match(base):
-            return name, re.sub(pat.pattern + r"\s*", "", base).strip()
+    base = cmd.strip().partition("\n")[0].replace(_HOME, "~")
+    m = _BASH_RE.match(base)
+    if m and m.lastgroup:
+        return _BASH_NAMES[m.lastgroup], base[m.end() :].strip()
     return "run", base
 
 
 def _short(text: str, limit: int = 100) -> str:
-    text = " ".join(text.strip().replace("\r", "").split())
+    # at most `limit` words can reach the output, so long tool output is never split past them
+    words = text.replace("\r", "").split(None, limit)
+    if len(words) > limit:
+        del words[limit:]
+    text = " ".join(words)
     return text if len(text) <= limit else text[: limit - 1] + "…"
 
 
+def _as_str(value: object) -> str:
+    """str() without the copy for values json already decoded as str; None maps to ""."""
+    if type(value) is str:
+        return value
+    return "" if value is None else str(value)
+
+
 def _stringify_content(value: object) -> str:
     if isinstance(value, str):
         return value
@@ -89,69 +121,100 @@ def _stringify_content(value: object) -> str:
     return str(value)
 
 
-def _normalize(event: dict[str, Any], tool_map: dict[str, str]) -> list[dict[str, Any]]:
-    t = event.get("type")
-
-    if t in {"system", "context_init"}:
-        return [{"type": "system", "model": event.get("model", "")}]
+def _norm_system(event: dict[str, Any], tool_map: dict[str, str]) -> list[dict[str, Any]]:
+    return [{"type": "system", "model": event.get("model", "")}]
+
+
+def _norm_error(event: dict[str, Any], tool_map: dict[str, str]) -> list[dict[str, Any]]:
+    msg = event.get("error") or event.get("message") or event.get("result") or "unknown error"
+    if isinstance(msg, dict):
+        msg = msg.get("message") or str(msg)
+    return [{"type": "error", "message": str(msg)}]
+
+
+def _norm_result(event: dict[str, Any], tool_map: dict[str, str]) -> list[dict[str, Any]]:
+    return _norm_error(event, tool_map) if event.get("subtype") == "error" else []
+
+
+def _norm_assistant(event: dict[str, Any], tool_map: dict[str, str]) -> list[dict[str, Any]]:
+    msg = event.get("message", {})
+    if not isinstance(msg, dict):
+        return []
+    out: list[dict[str, Any]] = []
+    usage = msg.get("usage")
+    if isinstance(usage, dict):
+        out.append(
+            {
+                "type": "usage",
+                "input_tokens": int(usage.get("input_tokens", 0)),
+                "output_tokens": int(usage.get("output_tokens", 0)),
+            }
+        )
+    append = out.append
+    for block in msg.get("content", []):
+        if not isinstance(block, dict):
+            continue
+        get = block.get
+        bt = get("type")
+        if bt == "text":
+            text = get("text", "")
+            if isinstance(text, str) and (text := text.strip()):
+                append({"type": "assistant_text", "text": text})
+        elif bt == "tool_use":
+            # tool names repeat across every call; interned, later map lookups hit on identity
+            tid, name = _as_str(get("id")), sys.intern(_as_str(get("name")))
+            if tid and name:
+                tool_map[tid] = name
+            append({"type": "tool_call", "tool_use_id": tid, "tool_name": name, "args": get("input", {})})
+    return out
+
+
+def _norm_user(event: dict[str, Any], tool_map: dict[str, str]) -> list[dict[str, Any]]:
+    msg = event.get("message", {})
+    if not isinstance(msg, dict):
+        return []
+    out = []
+    append = out.append
+    for block in msg.get("content", []):
+        if not isinstance(block, dict):
+            continue
+        get = block.get
+        if get("type") != "tool_result":
+            continue
+        tid = _as_str(get("tool_use_id"))
+        # a result closes its call, so the id -> name entry is no longer needed
+        mapped = tool_map.pop(tid, "")
+        append(
+            {
+                "type": "tool_result",
+                "tool_use_id": tid,
+                "tool_name": get("tool_name") or mapped,
+                "result": _stringify_content(get("content", "")),
+                "is_error": bool(get("is_error")),
+            }
+        )
+    return out
+
+
+_NORMALIZERS: dict[str, Callable[[dict[str, Any], dict[str, str]], list[dict[str, Any]]]] = {
+    "system": _norm_system,
+    "context_init": _norm_system,
+    "error": _norm_error,
+    "result": _norm_result,
+    "assistant": _norm_assistant,
+    "user": _norm_user,
+}
 
-    if t == "error" or (t == "result" and event.get("subtype") == "error"):
-        msg = event.get("error") or event.get("message") or event.get("result") or "unknown error"
-        if isinstance(msg, dict):
-            msg = msg.get("message") or str(msg)
-        return [{"type": "error", "message": str(msg)}]
 
-    if t == "assistant":
-        msg = event.get("message", {})
-        if not isinstance(msg, dict):
-            return []
-        out: list[dict[str, Any]] = []
-        usage = msg.get("usage")
-        if isinstance(usage, dict):
-            out.append(
-                {
-                    "type": "usage",
-                    "input_tokens": int(usage.get("input_tokens", 0)),
-                    "output_tokens": int(usage.get("output_tokens", 0)),
-                }
-            )
-        for block in msg.get("content", []):
-            if not isinstance(block, dict):
-                continue
-            bt = block.get("type")
-            if bt == "text":
-                text = block.get("text", "")
-                if isinstance(text, str) and text.strip():
-                    out.append({"type": "assistant_text", "text": text.strip()})
-            elif bt == "tool_use":
-                tid = str(block.get("id", ""))
-                name = str(block.get("name", ""))
-                if tid and name:
-                    tool_map[tid] = name
-                out.append({"type": "tool_call", "tool_use_id": tid, "tool_name": name, "args": block.get("input", {})})
-        return out
+def _normalize(event: dict[str, Any], tool_map: dict[str, str]) -> list[dict[str, Any]]:
+    handler = _NORMALIZERS.get(event.get("type", ""))
+    return handler(event, tool_map) if handler else []
 
-    if t == "user":
-        msg = event.get("message", {})
-        if not isinstance(msg, dict):
-            return []
-        out = []
-        for block in msg.get("content", []):
-            if not isinstance(block, dict) or block.get("type") != "tool_result":
-                continue
-            tid = str(block.get("tool_use_id", ""))
-            out.append(
-                {
-                    "type": "tool_result",
-                    "tool_use_id": tid,
-                    "tool_name": block.get("tool_name") or tool_map.get(tid, ""),
-                    "result": _stringify_content(block.get("content", "")),
-                    "is_error": bool(block.get("is_error")),
-                }
-            )
-        return out
 
-    return []
+def _cap(d: dict[str, Any]) -> None:
+    # dicts keep insertion order, so the first key is always the oldest
+    while len(d) > _TOOL_MAP_MAX:
+        del d[next(iter(d))]
 
 
 class StreamParser:
@@ -162,91 +225,118 @@ class StreamParser:
         self.ctx_tokens: int | None = None
 
     def parse_line(self, line: str) -> list[dict[str, Any]]:
-        raw = line.strip()
-        if not raw:
-            return []
+        # every event is a JSON object; sniff the first byte before paying for a decode (or its exception)
+        if not line.startswith("{"):
+            line = line.lstrip()
+            if not line.startswith("{"):
+                return []
         try:
-            event = json.loads(raw)
+            event = _decode_json(line)
         except json.JSONDecodeError:
             return []
         if not isinstance(event, dict):
             return []
+        entries = _normalize(event, self._tool_map)
+        if event.get("type") != "user":
+            # only user events carry tool results; everything else passes through as normalized
+            for entry in entries:
+                self._track(entry)
+            return entries
         out = []
-        for entry in _normalize(event, self._tool_map):
-            if entry.get("type") == "usage":
-                tok = entry.get("input_tokens")
-                if isinstance(tok, int) and tok > 0:
-                    self.ctx_tokens = tok
-            if entry.get("type") == "tool_call":
-                tid = str(entry.get("tool_use_id", ""))
-                if tid:
-                    self._pending[tid] = entry
-                out.append(entry)
-            elif entry.get("type") == "tool_result":
-                tid = str(entry.get("tool_use_id", ""))
-                call = self._pending.pop(tid, None)
-                if call:
-                    out.append({**call, "_result": entry})
-                if entry.get("is_error"):
-                    out.append(entry)
-            else:
+        for entry in entries:
+            call = self._pending.pop(entry["tool_use_id"], None)
+            if call:
+                out.append({**call, "_result": entry})
+            if entry["is_error"]:
                 out.append(entry)
         return out
 
+    def _track(self, entry: dict[str, Any]) -> None:
+        kind = entry["type"]
+        if kind == "tool_call":
+            if tid := entry["tool_use_id"]:
+                self._pending[tid] = entry
+                _cap(self._pending)
+                _cap(self._tool_map)
+        elif kind == "usage":
+            tok = entry["input_tokens"]
+            if tok > 0:
+                self.ctx_tokens = tok
+
     def flush(self) -> list[dict[str, Any]]:
         out = list(self._pending.values())
         self._pending.clear()
         return out
 
 
-def format_entry(entry: dict[str, Any], quiet_system: bool = True) -> str | None:
-    kind = entry.get("type", "")
-
-    if kind == "system":
-        if quiet_system:
-            return None
-        return f"{_DIM}  session init{_R}"
-
-    if kind == "assistant_text":
-        tok = entry.get("_ctx_tokens")
-        tok_str = f" {_GRAY}{tok // 1000}k{_R}" if isinstance(tok, int) and tok >= 1000 else ""
-        text = _short(entry.get("text", ""), 120).lower()
-        return f"  {_B}{_FOREST}hm…{_R}{tok_str} {_FOREST}{text}{_R}"
-
-    if kind == "tool_call":
-        raw_name = str(entry.get("tool_name") or "unknown")
-        args = entry.get("args", {}) or {}
-        name = _TOOL_DISPLAY.get(raw_name, raw_name.lower())
-        if raw_name == "Bash":
-            cmd = str(args.get("command", "")).split("\n")[0].replace(_HOME, "~")
-            name, arg = _parse_bash(cmd)
-            name = _TOOL_DISPLAY.get(name, name)
-        elif raw_name == "WebFetch":
-            arg = str(args.get("url", ""))
-        elif raw_name == "WebSearch":
-            arg = str(args.get("query", ""))
-        else:
-            arg = str(args.get("path") or args.get("file_path") or args.get("pattern") or "")
-        color = _TOOL_COLORS.get(name, _GRAY)
-        result = entry.get("_result")
-        suffix = ""
-        if isinstance(result, dict) and result.get("is_error"):
-            err = _short(str(result.get("result", "")), 60)
-            suffix = f" {_CORAL}{err}{_R}"
-        return f"  {_B}{color}{name}{_R} {_GRAY}{_short(arg, 80)}{_R}{suffix}"
-
-    if kind == "tool_result" and entry.get("is_error"):
-        tool = str(entry.get("tool_name", ""))
-        err = _short(str(entry.get("result", "")), 80)
-        return f"  {_B}{_RED}oops.{_R} {_CORAL}{tool} {err}{_R}"
-
-    if kind == "error":
-        return f"  {_B}{_RED}error.{_R} {_CORAL}{_short(str(entry.get('message', '')), 200)}{_R}"
-
-    if kind == "usage":
-        in_tok = entry.get("input_tokens", 0)
-        out_tok = entry.get("output_tokens", 0)
-        if in_tok or out_tok:
-            return f"  {_DIM}in={in_tok} out={out_tok}{_R}"
+def _fmt_system(entry: dict[str, Any], quiet_system: bool) -> str | None:
+    return None if quiet_system else f"{_DIM}  session init{_R}"
+
+
+@lru_cache(maxsize=256)
+def _tok_label(k: int) -> str:
+    # context size moves in whole-k steps, so a session repeats the same few labels
+    return f" {_GRAY}{k}k{_R}"
+
+
+def _fmt_assistant_text(entry: dict[str, Any], quiet_system: bool) -> str | None:
+    tok = entry.get("_ctx_tokens")
+    tok_str = _tok_label(tok // 1000) if isinstance(tok, int) and tok >= 1000 else ""
+    text = _short(entry.get("text", ""), 120).lower()
+    return f"  {_B}{_FOREST}hm…{_R}{tok_str} {_FOREST}{text}{_R}"
+
+
+def _fmt_tool_call(entry: dict[str, Any], quiet_system: bool) -> str | None:
+    raw_name = str(entry.get("tool_name") or "unknown")
+    args = entry.get("args", {}) or {}
+    name = _TOOL_DISPLAY.get(raw_name, raw_name.lower())
+    if raw_name == "Bash":
+        # _parse_bash does the home substitution; only cut to the first line here
+        name, arg = _parse_bash(str(args.get("command", "")).partition("\n")[0])
+        name = _TOOL_DISPLAY.get(name, name)
+    elif key := _TOOL_ARG_KEYS.get(raw_name):
+        arg = str(args.get(key, ""))
+    else:
+        arg = str(args.get("path") or args.get("file_path") or args.get("pattern") or "")
+    label = _TOOL_LABELS.get(name) or f"{_B}{_GRAY}{name}{_R}"
+    result = entry.get("_result")
+    suffix = ""
+    if isinstance(result, dict) and result.get("is_error"):
+        err = _short(str(result.get("result", "")), 60)
+        suffix = f" {_CORAL}{err}{_R}"
+    return f"  {label} {_GRAY}{_short(arg, 80)}{_R}{suffix}"
+
+
+def _fmt_tool_result(entry: dict[str, Any], quiet_system: bool) -> str | None:
+    if not entry.get("is_error"):
+        return None
+    tool = str(entry.get("tool_name", ""))
+    err = _short(str(entry.get("result", "")), 80)
+    return f"  {_B}{_RED}oops.{_R} {_CORAL}{tool} {err}{_R}"
 
+
+def _fmt_error(entry: dict[str, Any], quiet_system: bool) -> str | None:
+    return f"  {_B}{_RED}error.{_R} {_CORAL}{_short(str(entry.get('message', '')), 200)}{_R}"
+
+
+def _fmt_usage(entry: dict[str, Any], quiet_system: bool) -> str | None:
+    in_tok = entry.get("input_tokens", 0)
+    out_tok = entry.get("output_tokens", 0)
+    if in_tok or out_tok:
+        return f"  {_DIM}in={in_tok} out={out_tok}{_R}"
     return None
+
+
+_FORMATTERS: dict[str, Callable[[dict[str, Any], bool], str | None]] = {
+    "system": _fmt_system,
+    "assistant_text": _fmt_assistant_text,
+    "tool_call": _fmt_tool_call,
+    "tool_result": _fmt_tool_result,
+    "error": _fmt_error,
+    "usage": _fmt_usage,
+}
+
+
+def format_entry(entry: dict[str, Any], quiet_system: bool = True) -> str | None:
+    formatter = _FORMATTERS.get(entry.get("type", ""))
+    return formatter(entry, quiet_system) if formatter else None
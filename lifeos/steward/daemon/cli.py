@@ -24,17 +24,35 @@ def _launchd_loaded() -> bool:
     return result.returncode == 0
 
 
+def _plist_current() -> bool:
+    try:
+        src, dst = _PLIST_SRC.stat(), _PLIST_DST.stat()
+    except OSError:
+        return False
+    return src.st_size == dst.st_size and src.st_mtime_ns == dst.st_mtime_ns
+
+
 def _launchd_start() -> None:
-    _PLIST_DST.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(_PLIST_SRC, _PLIST_DST)
+    if not _plist_current():
+        _PLIST_DST.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(_PLIST_SRC, _PLIST_DST)
     subprocess.run(["launchctl", "load", str(_PLIST_DST)], capture_output=True)
 
 
 def _launchd_stop() -> None:
+    if not _PLIST_DST.exists():
+        return
     subprocess.run(["launchctl", "unload", str(_PLIST_DST)], capture_output=True)
     _PLIST_DST.unlink(missing_ok=True)
 
 
+def _launchd_reload() -> None:
+    """Unload and reload in place; restart keeps an up-to-date plist rather than deleting and recopying it."""
+    if _PLIST_DST.exists():
+        subprocess.run(["launchctl", "unload", str(_PLIST_DST)], capture_output=True)
+    _launchd_start()
+
+
 def _kill_supervisor(p: int) -> None:
     with contextlib.suppress(ProcessLookupError):
         os.killpg(p, _signal.SIGTERM)
@@ -98,8 +116,7 @@ def daemon_restart() -> None:
     """restart daemon"""
     if p := pid():
         _kill_supervisor(p)
-    _launchd_stop()
-    _launchd_start()
+    _launchd_reload()
     for _ in range(30):
         time.sleep(0.1)
         if new_p := pid():
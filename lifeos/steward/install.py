@@ -17,6 +17,16 @@ def install():
         if src.suffix == ".plist" or not src.is_file():
             continue
         dst = BIN_DIR / src.name
-        shutil.copy2(src, dst)
-        dst.chmod(0o755)
+        if not _same_file(src, dst):
+            shutil.copy2(src, dst)
+            dst.chmod(0o755)
         print(f"  {src.name} → {dst}")
+
+
+def _same_file(src: Path, dst: Path) -> bool:
+    """copy2 preserves mtime, so an unchanged size + mtime means the copy is current."""
+    try:
+        a, b = src.stat(), dst.stat()
+    except OSError:
+        return False
+    return a.st_size == b.st_size and a.st_mtime_ns == b.st_mtime_ns
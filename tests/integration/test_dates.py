@@ -1,3 +1,7 @@
+from datetime import date
+
+from lifeos.core.lib import clock
+from lifeos.core.lib.dates import add_date, list_dates
 from tests.conftest import invoke
 
 
@@ -59,3 +63,16 @@ def test_invalid_date_format_fails(tmp_life_dir):
     result = invoke(["dates", "add", "test", "2025-12-25"])
 
     assert result.exit_code != 0
+
+
+def test_list_dates_sorted_by_next_occurrence(tmp_life_dir, monkeypatch):
+    monkeypatch.setattr(clock, "today", lambda: date(2025, 6, 15))
+    add_date("past", "01-03")
+    add_date("later", "01-12")
+    add_date("soon", "20-06")
+    add_date("now", "15-06")
+
+    dates = list_dates()
+
+    assert [d["name"] for d in dates] == ["now", "soon", "later", "past"]
+    assert [d["days_until"] for d in dates] == [0, 5, 169, 259]
@@ -1,4 +1,18 @@
-from lifeos.core.lib.ansi import DEFAULT, POOL, Theme, bold, dim, strip, strip_markdown
+from lifeos.core.lib.ansi import (
+    DEFAULT,
+    POOL,
+    Theme,
+    agent_color,
+    bold,
+    dim,
+    green,
+    highlight_path,
+    highlight_references,
+    mention,
+    strip,
+    strip_markdown,
+    use,
+)
 
 
 def test_theme_defaults():
@@ -21,6 +35,16 @@ def test_bold():
     assert "\033[0m" in result
 
 
+def test_use_rebinds_wrappers():
+    use(Theme(bold="<b>", green="<g>", reset="</>"))
+    try:
+        assert bold("hi") == "<b>hi</>"
+        assert green("hi") == "<g>hi</>"
+    finally:
+        use(DEFAULT)
+    assert bold("hi") == "\033[1mhi\033[0m"
+
+
 def test_dim():
     result = dim("hi")
     assert "\033[2m" in result
@@ -34,3 +58,69 @@ def test_strip():
 def test_strip_markdown():
     assert strip_markdown("**bold**") == "bold"
     assert strip_markdown("`code`") == "code"
+    assert strip_markdown("## heading") == "heading"
+    assert strip_markdown("[docs](https://x.y)") == "docs"
+    assert strip_markdown("*a **b** c*") == "a b c"
+
+
+def test_strip_markdown_headings_only_at_line_start():
+    assert strip_markdown("### a\n#### b **c**") == "a\nb c"
+    assert strip_markdown("#tag and # not heading") == "#tag and # not heading"
+    assert strip_markdown("foo **# x**") == "foo # x"
+
+
+def test_strip_markdown_empty_heading_keeps_its_line():
+    assert strip_markdown("# \n") == "\n"
+    assert strip_markdown("#\n") == "#\n"
+    assert strip_markdown("#\nnext") == "#\nnext"
+    assert strip_markdown("## \n  text") == "\n  text"
+
+
+def test_strip_markdown_nested():
+    assert strip_markdown("**`x`**") == "x"
+    assert strip_markdown("[**a**](u) and *b*") == "a and b"
+
+
+def test_strip_markdown_plain_passthrough():
+    text = "nothing to strip"
+    assert strip_markdown(text) is text
+
+
+def test_strip_only_removes_sgr():
+    assert strip("\033[2Kline\033[38;5;80m!\033[0m") == "\033[2Kline!"
+
+
+def test_strip_plain_passthrough():
+    text = "no escapes here"
+    assert strip(text) is text
+
+
+def test_highlight_path_colors_paths():
+    out = highlight_path("see ~/life/notes.md", base_color="<c>")
+    assert out.startswith("<c>see ")
+    assert "~/life/notes.md" in out
+
+
+def test_highlight_path_without_slash_only_applies_base():
+    assert highlight_path("plain words", base_color="<c>") == "<c>plain words"
+    assert highlight_path("plain words") == "plain words"
+
+
+def test_highlight_references_wraps_full_ref():
+    out = highlight_references("see t/abcdef12 now", base_color="<c>")
+    assert out == "see \033[1;38;5;117mt/abcdef12\033[0m<c> now"
+
+
+def test_mention_folds_bold_into_color():
+    assert mention("steward") == f"\033[1;{agent_color('steward')[2:]}@steward\033[0m"
+
+
+def test_agent_color_stable_and_case_insensitive():
+    assert agent_color("Steward") == agent_color("steward")
+    assert agent_color("steward").startswith("\033[38;5;")
+
+
+def test_agent_color_stable_across_processes():
+    # crc32, not hash(): str hashing is salted per process and would reshuffle colors every run.
+    assert agent_color("steward") == "\033[38;5;138m"
+    assert agent_color("tyson") == "\033[38;5;62m"
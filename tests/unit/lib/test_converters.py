@@ -187,3 +187,11 @@ def test_hydrate_tags_empty():
     )
     hydrated = hydrate_tags_onto(task, [])
     assert hydrated.tags == []
+
+
+def test_id8_is_short_id():
+    now = datetime.now()
+    task = Task(id="abcdef12-3456", content="x", focus=False, scheduled_date=None, created=now, completed_at=None)
+    habit = Habit(id="12345678-abcd", content="y", created=now)
+    assert task.id8 == "abcdef12"
+    assert habit.id8 == "12345678"
@@ -0,0 +1,30 @@
+from datetime import date
+
+from lifeos.core.lib import clock
+from lifeos.core.lib.dates import is_hhmm, parse_due_date
+
+
+def test_parse_due_date_relative(monkeypatch):
+    monkeypatch.setattr(clock, "today", lambda: date(2025, 3, 5))
+    assert parse_due_date("today") == "2025-03-05"
+    assert parse_due_date("Yesterday") == "2025-03-04"
+    assert parse_due_date("tomorrow") == "2025-03-06"
+
+
+def test_parse_due_date_weekday(monkeypatch):
+    monkeypatch.setattr(clock, "today", lambda: date(2025, 3, 5))  # wednesday
+    assert parse_due_date("wed") == "2025-03-05"
+    assert parse_due_date("thursday") == "2025-03-06"
+    assert parse_due_date("mon") == "2025-03-10"
+
+
+def test_parse_due_date_time_only_is_not_a_date():
+    assert parse_due_date("14:30") is None
+
+
+def test_is_hhmm():
+    assert is_hhmm("9:05")
+    assert is_hhmm("23:59")
+    assert not is_hhmm("123:00")
+    assert not is_hhmm("9:5")
+    assert not is_hhmm("12:30:00")
@@ -1,5 +1,6 @@
 """Tests for steward env module — mirrors spacebrr's test_launch_env.py."""
 
+from lifeos.core.lib import env
 from lifeos.core.lib.env import build_base_env, is_auto, is_chat, is_interactive, is_tg, mode
 
 
@@ -58,3 +59,13 @@ def test_build_base_env_does_not_leak_host_secrets(monkeypatch):
     env = build_base_env("auto")
     assert "OPENAI_API_KEY" not in env
     assert "ANTHROPIC_AUTH_TOKEN" not in env
+
+
+def test_build_base_env_picks_up_rewritten_key_file(tmp_path, monkeypatch):
+    key_file = tmp_path / "api_key"
+    monkeypatch.setattr(env, "_API_KEY_FILE", key_file)
+    assert "ANTHROPIC_API_KEY" not in build_base_env("auto")
+    key_file.write_text("sk-one\n")
+    assert build_base_env("auto")["ANTHROPIC_API_KEY"] == "sk-one"
+    key_file.write_text("sk-two-longer\n")
+    assert build_base_env("auto")["ANTHROPIC_API_KEY"] == "sk-two-longer"
@@ -1,6 +1,7 @@
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 
-from lifeos.core.lib.format import format_due
+from lifeos.core.lib.ansi import strip
+from lifeos.core.lib.format import build_due_cache, fmt_time, format_due, format_row, write_rows
 
 
 def test_format_due_today():
@@ -35,3 +36,32 @@ def test_format_due_empty():
 def test_format_due_none():
     result = format_due(None)
     assert result == ""
+
+
+def test_format_due_accepts_date_and_str():
+    d = date(2025, 3, 7)
+    assert format_due(d, colorize=False) == format_due("2025-03-07", colorize=False) == "07/03·"
+
+
+def test_build_due_cache_matches_format_due():
+    d = date(2025, 3, 7)
+    cache = build_due_cache([d, None, d])
+    assert cache == {d: format_due(d)}
+
+
+def test_write_rows_single_write(capsys):
+    write_rows([format_row("a", [], "abcdef1234"), format_row("b", [], "1234abcdef", symbol="✓")])
+    out = strip(capsys.readouterr().out)
+    assert out == "  □ a [abcdef12]\n  ✓ b [1234abcd]\n"
+
+
+def test_write_rows_empty_writes_nothing(capsys):
+    write_rows([])
+    assert capsys.readouterr().out == ""
+
+
+def test_fmt_time_strings_and_datetimes():
+    assert fmt_time("09:05") == "9:05"
+    assert fmt_time("09:05") == "9:05"
+    assert fmt_time("14:30") == "14:30"
+    assert fmt_time(datetime(2025, 1, 1, 7, 3)) == "7:03"
@@ -0,0 +1,58 @@
+from datetime import datetime
+
+import pytest
+
+from lifeos.core.errors import AmbiguousError
+from lifeos.core.lib.fuzzy import find_in_pool, find_in_pool_exact
+from lifeos.core.models import Task
+
+
+def _task(id_: str, content: str) -> Task:
+    created = datetime(2025, 1, 1)
+    return Task(id=id_, content=content, focus=False, scheduled_date=None, created=created, completed_at=None)
+
+
+POOL = [
+    _task("aaaa1111-0000", "Buy milk"),
+    _task("aaaa2222-0000", "Call mom"),
+    _task("bbbb3333-0000", "Read book"),
+]
+
+
+def test_uuid_prefix():
+    assert find_in_pool("bbbb", POOL) is POOL[2]
+
+
+def test_uuid_prefix_ambiguous():
+    with pytest.raises(AmbiguousError):
+        find_in_pool("aaaa", POOL)
+
+
+def test_non_hex_ref_skips_uuid_match():
+    pool = [_task("milk0000-0000", "Call mom"), _task("cccc4444-0000", "milk tea")]
+    assert find_in_pool("milk", pool) is pool[1]
+
+
+def test_exact_content_case_insensitive():
+    assert find_in_pool("call MOM", POOL) is POOL[1]
+
+
+def test_substring():
+    assert find_in_pool("milk", POOL) is POOL[0]
+
+
+def test_fuzzy():
+    assert find_in_pool("red book", POOL) is POOL[2]
+    assert find_in_pool_exact("red book", POOL) is None
+
+
+def test_fuzzy_ambiguous_samples_in_pool_order():
+    pool = [_task("1", "read books"), _task("2", "read book"), _task("3", "gym")]
+    with pytest.raises(AmbiguousError) as exc:
+        find_in_pool("reed book", pool)
+    assert exc.value.sample == ["read books", "read book"]
+
+
+def test_no_match():
+    assert find_in_pool("zzz", POOL) is None
+    assert find_in_pool("x", []) is None
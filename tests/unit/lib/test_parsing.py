@@ -0,0 +1,34 @@
+from datetime import date
+
+import pytest
+
+from lifeos.core.lib import clock
+from lifeos.core.lib.parsing import _try_parse_time, parse_due_and_item, parse_time
+
+
+def test_try_parse_time_pads():
+    assert _try_parse_time("9:05") == "09:05"
+    assert _try_parse_time(" 23:59 ") == "23:59"
+
+
+def test_try_parse_time_rejects():
+    for bad in ["24:00", "12:60", "123:00", "9:5", "ab:cd", "", "12:30:00"]:
+        assert _try_parse_time(bad) is None, bad
+
+
+def test_parse_time_raises():
+    assert parse_time("7:30") == "07:30"
+    with pytest.raises(ValueError, match="use HH:MM"):
+        parse_time("later")
+
+
+def test_parse_due_and_item_leading_time(monkeypatch):
+    monkeypatch.setattr(clock, "today", lambda: date(2025, 3, 5))
+    assert parse_due_and_item(["14:30", "call", "mom"]) == ("2025-03-05", "14:30", "call mom")
+    assert parse_due_and_item(["tomorrow", "9:00", "gym"]) == ("2025-03-06", "09:00", "gym")
+
+
+def test_parse_due_and_item_trailing_date(monkeypatch):
+    monkeypatch.setattr(clock, "today", lambda: date(2025, 3, 5))
+    assert parse_due_and_item(["call", "mom", "friday"]) == ("2025-03-07", None, "call mom")
+    assert parse_due_and_item(["plain", "task"]) == (None, None, "plain task")
@@ -1,5 +1,7 @@
 from life.resolve import resolve_item, resolve_item_any, resolve_task
 from life.task import add_task, check_task
+from lifeos.core.lib import resolve as people
+from lifeos.core.lib.resolve import resolve_people_field
 
 
 def test_resolve_task_finds_pending(tmp_life_dir):
@@ -46,3 +48,32 @@ def test_resolve_item_finds_today_completed(tmp_life_dir):
     assert task is not None
     task, _ = resolve_item("completed task")
     assert task.id == completed_id
+
+
+def test_resolve_item_any_sees_writes(tmp_life_dir):
+    task_id = add_task("water plants", tags=["home"])
+    task, _ = resolve_item_any("water plants")
+    assert task is not None
+    assert task.completed_at is None
+    check_task(task_id)
+    task, _ = resolve_item_any("water plants")
+    assert task is not None
+    assert task.completed_at is not None
+
+
+def test_resolve_people_field_by_stem_then_name(tmp_path, monkeypatch):
+    monkeypatch.setattr(people, "_PEOPLE_DIR", tmp_path)
+    (tmp_path / "alex.md").write_text("---\nname: Alex Doe\ntelegram: 111\n---\n")
+    (tmp_path / "sam.md").write_text("---\nname: Samantha\ntelegram: 222\n---\n")
+    assert resolve_people_field("Alex", "telegram") == "111"
+    assert resolve_people_field("samantha", "telegram") == "222"
+    assert resolve_people_field("alex", "signal") is None
+
+
+def test_resolve_people_field_rereads_edited_profile(tmp_path, monkeypatch):
+    monkeypatch.setattr(people, "_PEOPLE_DIR", tmp_path)
+    profile = tmp_path / "alex.md"
+    profile.write_text("---\ntelegram: 111\n---\n")
+    assert resolve_people_field("alex", "telegram") == "111"
+    profile.write_text("---\ntelegram: 22222\n---\n")
+    assert resolve_people_field("alex", "telegram") == "22222"
@@ -0,0 +1,15 @@
+from lifeos.core.lib.tags import load_tag_overrides
+
+
+def test_load_tag_overrides_missing_file(tmp_path, monkeypatch):
+    monkeypatch.setenv("LIFE_DIR", str(tmp_path))
+    assert load_tag_overrides() == {}
+
+
+def test_load_tag_overrides_sees_rewrites(tmp_path, monkeypatch):
+    monkeypatch.setenv("LIFE_DIR", str(tmp_path))
+    path = tmp_path / "tags.toml"
+    path.write_text('work = "sky"\n')
+    assert load_tag_overrides() == {"work": "sky"}
+    path.write_text('work = "rose"\nhome = "lime"\n')
+    assert load_tag_overrides() == {"work": "rose", "home": "lime"}
@@ -8,6 +8,7 @@ from life.dash import (
 from life.habit import add_habit, get_habits, toggle_check
 from life.task import add_task, check_task, get_tasks
 from life.task.render import render_dashboard
+from life.task.rows import fmt_rel_date
 from lifeos.core.lib.ansi import theme
 from lifeos.core.lib.store import get_db
 
@@ -174,3 +175,23 @@ def test_render_checked_habit_not_red(tmp_life_dir, monkeypatch):
     completed = get_today_completed()
     output = render_dashboard(items, (1, 0, 0, 0), today_items=completed)
     assert theme.red not in output
+
+
+def test_render_dashboard_buckets_tasks_by_date(tmp_life_dir, monkeypatch):
+    _make_render_ctx(monkeypatch, datetime(2025, 10, 30, 10, 0))
+    add_task("past thing", scheduled_date="2025-10-28")
+    add_task("now thing", scheduled_date="2025-10-30")
+    add_task("next thing", scheduled_date="2025-10-31")
+    output = render_dashboard(get_tasks() + get_habits(), (0, 0, 0, 0))
+    before_overdue, from_overdue = output.split("OVERDUE", 1)
+    overdue_section, from_tomorrow = from_overdue.split("TOMORROW", 1)
+    assert "now thing" in before_overdue
+    assert "past thing" in overdue_section
+    assert "next thing" in from_tomorrow
+
+
+def test_fmt_rel_date_labels():
+    today = datetime(2025, 10, 30).date()
+    assert fmt_rel_date(today + timedelta(days=2), today) == "sat"
+    assert fmt_rel_date(today + timedelta(days=2), today, "9:00") == "sat·9:00"
+    assert fmt_rel_date(today + timedelta(days=10), today) == "+10d"
@@ -33,6 +33,7 @@ def test_init_creates_indexes(tmp_life_dir):
         index_names = {i[0] for i in indexes}
         assert "idx_tags_task" in index_names or "idx_tags_habit" in index_names
         assert "idx_checks_date" in index_names
+        assert {"idx_mutations_field_at", "idx_mutations_reason_at", "idx_moods_logged_at"} <= index_names
 
 
 def test_get_db_context_manager(tmp_life_dir):
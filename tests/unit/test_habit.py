@@ -3,6 +3,7 @@ from life.habit import (
     get_checks,
     get_habit,
     get_habits,
+    get_subhabits_by_parent,
     merge_habit,
     toggle_check,
 )
@@ -69,3 +70,13 @@ def test_merge_habit_skips_conflicting_dates(tmp_life_dir):
 
     target = get_habit(target_id)
     assert len(target.checks) == 1
+
+
+def test_get_subhabits_by_parent(tmp_life_dir):
+    parent = add_habit("morning")
+    first = add_habit("stretch", parent_id=parent)
+    second = add_habit("water", parent_id=parent)
+    add_habit("evening")
+    by_parent = get_subhabits_by_parent()
+    assert list(by_parent) == [parent]
+    assert {h.id for h in by_parent[parent]} == {first, second}
@@ -0,0 +1,133 @@
+import json
+
+from lifeos.steward import _stream
+from lifeos.steward._stream import StreamParser, ansi_strip, format_entry
+
+
+def _line(event: dict) -> str:
+    return json.dumps(event)
+
+
+def test_parse_line_ignores_blank_and_garbage():
+    parser = StreamParser()
+    assert parser.parse_line("") == []
+    assert parser.parse_line("not json") == []
+    assert parser.parse_line("[1, 2]") == []
+    assert parser.parse_line("   \n") == []
+    padded = "  " + _line({"type": "system", "model": "m"}) + "\n"
+    assert parser.parse_line(padded) == [{"type": "system", "model": "m"}]
+
+
+def test_system_and_error_events():
+    parser = StreamParser()
+    assert parser.parse_line(_line({"type": "system", "model": "m"})) == [{"type": "system", "model": "m"}]
+    assert parser.parse_line(_line({"type": "error", "error": {"message": "boom"}})) == [
+        {"type": "error", "message": "boom"}
+    ]
+    assert parser.parse_line(_line({"type": "result", "subtype": "error", "result": "bad"})) == [
+        {"type": "error", "message": "bad"}
+    ]
+    assert parser.parse_line(_line({"type": "result", "subtype": "success"})) == []
+
+
+def test_tool_call_pairs_with_result():
+    parser = StreamParser()
+    call = {
+        "type": "assistant",
+        "message": {
+            "usage": {"input_tokens": 12000, "output_tokens": 5},
+            "content": [
+                {"type": "text", "text": "  thinking  "},
+                {"type": "tool_use", "id": "t1", "name": "Read", "input": {"file_path": "/x/y.py"}},
+            ],
+        },
+    }
+    entries = parser.parse_line(_line(call))
+    assert [e["type"] for e in entries] == ["usage", "assistant_text", "tool_call"]
+    assert parser.ctx_tokens == 12000
+
+    result = {"type": "user", "message": {"content": [{"type": "tool_result", "tool_use_id": "t1", "content": "ok"}]}}
+    paired = parser.parse_line(_line(result))
+    assert len(paired) == 1
+    assert paired[0]["tool_name"] == "Read"
+    assert paired[0]["_result"]["result"] == "ok"
+    assert parser.flush() == []
+
+
+def test_null_tool_id_is_empty_not_none():
+    parser = StreamParser()
+    block = {"type": "tool_use", "id": None, "name": "Bash"}
+    entries = parser.parse_line(_line({"type": "assistant", "message": {"content": [block]}}))
+    assert entries[0]["tool_use_id"] == ""
+    assert parser.flush() == []
+
+
+def test_error_result_is_surfaced_and_unpaired_calls_flush():
+    parser = StreamParser()
+    parser.parse_line(
+        _line({"type": "assistant", "message": {"content": [{"type": "tool_use", "id": "a", "name": "Bash"}]}})
+    )
+    parser.parse_line(
+        _line({"type": "assistant", "message": {"content": [{"type": "tool_use", "id": "b", "name": "Grep"}]}})
+    )
+    block = {"type": "tool_result", "tool_use_id": "a", "content": [{"text": "no"}], "is_error": True}
+    err = {"type": "user", "message": {"content": [block]}}
+    out = parser.parse_line(_line(err))
+    assert [e["type"] for e in out] == ["tool_call", "tool_result"]
+    assert out[1]["result"] == "no"
+    assert [e["tool_use_id"] for e in parser.flush()] == ["b"]
+
+
+def test_unanswered_calls_are_bounded(monkeypatch):
+    monkeypatch.setattr(_stream, "_TOOL_MAP_MAX", 2)
+    parser = StreamParser()
+    for tid in "abc":
+        block = {"type": "tool_use", "id": tid, "name": "Bash"}
+        parser.parse_line(_line({"type": "assistant", "message": {"content": [block]}}))
+    assert [e["tool_use_id"] for e in parser.flush()] == ["b", "c"]
+
+
+def test_format_tool_call_bash():
+    entry = {"type": "tool_call", "tool_name": "Bash", "args": {"command": "git status --short\nignored"}}
+    assert ansi_strip(format_entry(entry) or "") == "  git status --short"
+
+
+def test_format_tool_call_bash_primitives():
+    def fmt(cmd: str) -> str:
+        return ansi_strip(format_entry({"type": "tool_call", "tool_name": "Bash", "args": {"command": cmd}}) or "")
+
+    assert fmt("uv run  pytest -q") == "  run pytest -q"
+    assert fmt("python3 x.py") == "  run x.py"
+    assert fmt("exa -la") == "  ls -la"
+    assert fmt("rg foo") == "  grep foo"
+    assert fmt("gitx log") == "  run gitx log"
+
+
+def test_format_tool_call_error_suffix():
+    entry = {
+        "type": "tool_call",
+        "tool_name": "Read",
+        "args": {"file_path": "a.py"},
+        "_result": {"is_error": True, "result": "missing"},
+    }
+    assert ansi_strip(format_entry(entry) or "") == "  read a.py missing"
+
+
+def test_format_assistant_text_and_quiet_system():
+    assert format_entry({"type": "system"}) is None
+    assert ansi_strip(format_entry({"type": "system"}, quiet_system=False) or "") == "  session init"
+    text = format_entry({"type": "assistant_text", "text": "Hello  World", "_ctx_tokens": 42000})
+    assert ansi_strip(text or "") == "  hm… 42k hello world"
+
+
+def test_format_usage_and_errors():
+    assert ansi_strip(format_entry({"type": "usage", "input_tokens": 3, "output_tokens": 4}) or "") == "  in=3 out=4"
+    assert format_entry({"type": "usage", "input_tokens": 0, "output_tokens": 0}) is None
+    assert ansi_strip(format_entry({"type": "error", "message": "x"}) or "") == "  error. x"
+    failed = {"type": "tool_result", "is_error": True, "tool_name": "Bash", "result": "exit 1"}
+    assert ansi_strip(format_entry(failed) or "") == "  oops. Bash exit 1"
+
+
+def test_format_error_truncates_long_output():
+    out = ansi_strip(format_entry({"type": "error", "message": "word\r\n  " * 5000}) or "")
+    assert out == "  error. " + ("word " * 40)[:199] + "…"
@@ -1,3 +1,4 @@
+from life.tag import get_tasks_by_tag
 from life.task import (
     add_task,
     check_task,
@@ -35,6 +36,14 @@ def test_add_task_with_tags(tmp_life_dir):
     assert "work" in task.tags
 
 
+def test_get_tasks_by_tag(tmp_life_dir):
+    task_id = add_task("tagged task", tags=["work"])
+    add_task("other task", tags=["home"])
+    tasks = get_tasks_by_tag("work")
+    assert [t.id for t in tasks] == [task_id]
+    assert tasks[0].tags == ["work"]
+
+
 def test_pending_tasks_sort_order(tmp_life_dir):
     add_task("task 1")
     add_task("task 2")
@@ -5,7 +5,9 @@ from life.feedback import build_feedback_snapshot
 from life.habit import add_habit, check_habit, get_habits, get_streak
 from life.momentum import weekly_momentum
 from life.task import get_all_tasks, get_tasks
+from life.task.rows import habit_counts
 from lifeos.core.lib.store import get_db
+from lifeos.core.models import Habit
 
 
 def test_add_weekly_habit(tmp_life_dir):
@@ -134,3 +136,18 @@ def test_weekly_momentum_total(tmp_life_dir, fixed_today):
     # 1 weekly habit = 1 possible per week
     assert momentum["this_week"].habits_total == 1
     assert momentum["last_week"].habits_total == 1
+
+
+def test_habit_counts_windows():
+    today = date(2025, 10, 30)
+    checks = [datetime.combine(today - timedelta(days=n), time(9)) for n in (0, 0, 6, 7, 13, 14, 20, 30)]
+    daily = Habit(id="h", content="run", created=datetime(2025, 1, 1), checks=checks)
+    assert habit_counts(daily, today) == (3, 2)
+    weekly = Habit(id="w", content="climb", created=datetime(2025, 1, 1), cadence="weekly", checks=checks)
+    assert habit_counts(weekly, today) == (4, 1)
+
+
+def test_habit_latest_check():
+    checks = [datetime(2025, 10, 28, 9), datetime(2025, 10, 30, 7), datetime(2025, 10, 29, 21)]
+    assert Habit(id="h", content="run", created=datetime(2025, 1, 1), checks=checks).latest_check == checks[1]
+    assert Habit(id="h", content="run", created=datetime(2025, 1, 1)).latest_check is None